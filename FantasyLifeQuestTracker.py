@@ -10,24 +10,29 @@ Modernized by Claude Code - Added sorting, search, caching, and performance impr
 import tkinter as tk
 from tkinter import *
 from tkinter import ttk
-from shutil import copyfile
-import pandas as pd
-from openpyxl import load_workbook
 import sys
-import webbrowser
 import array
-import io
+from modules.quest_snapshot import QuestSnapshot, SHEET_COLUMNS, ensure_snapshot
+from modules.progress_log import ProgressLog
+from modules.location_counts import LocationCounts
 
 global data #all 1296 quests here[0 and 1 are blank] currentprogress.txt
 data = []
+global binaryProgress #also keep statuses packed in currentprogress.bin (loads faster)
+binaryProgress = False
+global progress_log #currentprogress.txt + currentprogress.log of changes since, see modules/progress_log.py
+progress_log = ProgressLog("currentprogress.txt", binary_file="currentprogress.bin" if binaryProgress else None)
 global placedata #all 48 [0,47] place names here placenames.txt
 global topButton #which of the 5 btns [0. 4] at topright cur pressed
 topButton = 4
 global currentPlaceIndex #current place we are looking at, i.e. Lives
 currentPlaceIndex = 47
 global titleLocation #location for where to put the title Fantasy Life -
-global wb #excel workbook FLData.xlsx
-global text_scroll #for use to access text_scroll.frame to place data
+global snapshot #compiled quest data (FLData.xlsx + place lists), see modules/quest_snapshot.py
+global sheet_header #spreadsheet header row {column: title}
+global quest_grid #virtualized quest table on the right side, see QuestGrid
+global gridRows #rows of widgets in the quest table (reused while scrolling)
+gridRows = 30
 global URLCol #column where the URl is displayed
 URLCol = 3
 global turnInCol #turn in location
@@ -47,12 +52,20 @@ global text_frame
 global holdSelf
 global nameCol #column the name occurs in
 nameCol = 7
-global choice_container
-global minl
+global choice_container #status StringVar of each quest table row
+global minl #dataIndexArray index shown in the top quest table row
 minl=0
-global location_container_outer
+global location_container_outer #location StringVar of each quest table row
 global quest_cache  # Cached quest data from Excel to avoid repeated reads
 quest_cache = []
+global quest_by_row  # quest_by_row[row] -> quest_cache entry (None for rows 0 and 1)
+quest_by_row = []
+global place_index  # place name -> index into placedata[]
+place_index = {}
+global sort_orders  # sort option -> every row id in that order (see build_quest_cache)
+sort_orders = {}
+global location_counts  # place button counters (see initializeCount)
+location_counts = None
 global current_sort  # Current sort option: 'default', 'name', 'life', 'location', 'status'
 current_sort = 'default'
 global search_text  # Search filter text
@@ -61,47 +74,72 @@ global sort_var  # StringVar for sort dropdown
 global search_var  # StringVar for search box
 
 def read():
-    f = open("currentprogress.txt", "r")
     global data
-    #data = f.readlines()
-    data = f.read().splitlines() #removes the \n
-    f.close()
+    data = progress_log.load() #currentprogress.txt with logged changes applied
 
 def save():
+    #rewrites currentprogress.txt; single changes are appended to the log in callback
     global data
-    f = open("currentprogress.txt", "w")
-    f.writelines("%s\n" % l for l in data)
-    f.close()
+    progress_log.compact(data)
 
 def build_quest_cache():
-    """Build a cache of all quest data from Excel to avoid repeated cell reads"""
-    global quest_cache, wb, startLocationIndex, endLocationIndex, data
+    """Build a cache of all quest data from the compiled snapshot (no Excel reads)"""
+    global quest_cache, quest_by_row, place_index, sort_orders, snapshot, sheet_header, data
     quest_cache = []
+    quest_by_row = [None] * len(data)
+    sheet_header = snapshot.header()
+
+    # Same order as the place buttons built in Scrollbar.scrollMap
+    place_index = {}
+    for i, (name, _) in enumerate(snapshot.places()):
+        place_index.setdefault(name, i)
+
+    rows = {row['row_id']: row for row in snapshot.quests()}
+    locations = {}
+    for quest_id, location_name in snapshot.quest_locations():
+        locations.setdefault(quest_id, []).append(location_name)
 
     # Cache all quest data (rows 2 to len(data))
     for row_idx in range(2, len(data)):
+        row = rows.get(row_idx)
+
+        # Cache columns 2-9 for display
+        columns = {}
+        for col, field in SHEET_COLUMNS.items():
+            columns[col] = row[field] if row else None
+
         quest_info = {
             'row': row_idx,
             'status': int(data[row_idx]),
-            'url': wb['Sheet1'].cell(row=row_idx, column=URLCol).value,
-            'name': wb['Sheet1'].cell(row=row_idx, column=nameCol).value,
-            'life': wb['Sheet1'].cell(row=row_idx, column=livesCol).value,
-            'turn_in': wb['Sheet1'].cell(row=row_idx, column=turnInCol).value,
-            'locations': []  # List of location names where quest is available
+            'url': columns[URLCol],
+            'name': columns[nameCol],
+            'life': columns[livesCol],
+            'turn_in': columns[turnInCol],
+            'name_key': (str(columns[nameCol]) if columns[nameCol] else '').casefold(),  # sort/search key
+            'columns': columns,
+            'locations': locations.get(row_idx, [])  # List of location names where quest is available
         }
 
-        # Cache columns 2-9 for display
-        quest_info['columns'] = {}
-        for col in range(2, 10):
-            quest_info['columns'][col] = wb['Sheet1'].cell(row=row_idx, column=col).value
-
-        # Cache location availability
-        for col in range(startLocationIndex, endLocationIndex):
-            if wb['Sheet1'].cell(row=row_idx, column=col).value == 1:
-                location_name = wb['Sheet1'].cell(row=1, column=col).value
-                quest_info['locations'].append(location_name)
-
         quest_cache.append(quest_info)
+        quest_by_row[row_idx] = quest_info
+
+    # Sort each way once; gatherData keeps the rows it shows in these orders.
+    # Status changes at runtime, so that order is bucketed in gatherData instead
+    sort_keys = {
+        'name': lambda q: q['name_key'],
+        'life': lambda q: (str(q['life']) if q['life'] else 'zzz').casefold(),
+        'location': lambda q: (str(q['turn_in']) if q['turn_in'] else '').casefold()
+    }
+    sort_orders = {}
+    for mode, key in sort_keys.items():
+        sort_orders[mode] = [q['row'] for q in sorted(quest_cache, key=key)]
+
+def findQuest(row_idx):
+    """Cached quest for a spreadsheet row, or None"""
+    global quest_by_row
+    if 0 <= row_idx < len(quest_by_row):
+        return quest_by_row[row_idx]
+    return None
 
 def setText(obj):
         obj.text.set(str(obj.array[0]) + " / " +  str(obj.array[1]) + " / "  + str(obj.array[2]) + " / "  + str(obj.array[3]))
@@ -125,54 +163,39 @@ def changeTitle():
     titleLocation.title("Fantasy Life - {} - {}".format(placedata[currentPlaceIndex].key, findButtonName()))
   
 def findLocation(name):
-    global placedata
-    for i in range(len(placedata)):
-        if(placedata[i].key == name):
-            return i
-    return -1   
+    global place_index
+    return place_index.get(name, -1)
 
 def findLocationCol(name):
     global startLocationIndex
     global endLocationIndex
-    global wb
+    global sheet_header
     for i in range(startLocationIndex, endLocationIndex):
-        if(wb['Sheet1'].cell(row=1, column=i).value == name):
+        if(sheet_header.get(i) == name):
             return i
         
     return -1
     
 def OpenUrl(i, *args):
     """Open the wiki URL for a quest - now uses cached data"""
-    global quest_cache
-    # Find quest in cache by row index
-    for quest in quest_cache:
-        if quest['row'] == i:
-            if quest['url']:
-                webbrowser.open_new(quest['url'])
-            return
+    quest = findQuest(i)
+    if quest and quest['url']:
+        import webbrowser  # only needed once a link is clicked
+        webbrowser.open_new(quest['url'])
 
 def locationcallback(i, *args):
     global location_container_outer
     global currentPlaceIndex
-    global text_scroll
-    global text_frame
-    global holdSelf
     global topButton
     topButton = 1
     currentPlaceIndex = findLocation(location_container_outer[i-minl].get())
     changeTitle()
-    text_frame.destroy()
-    text_frame = Frame(holdSelf)
-    text_frame.pack_propagate(0)
-    text_frame.config(height=1000, width=1230)
-    text_frame.pack()
-    text_scroll = Scrollbar(text_frame, "Text")
     gatherData()
     
 
 def callback(i, *args):
     """Handle quest status changes - now uses cached data for better performance"""
-    global dataIndexArray, choice_container, placedata, quest_cache
+    global dataIndexArray, choice_container, placedata, location_counts
     choices = ['Unobtained','Obtained','Completed','Turned In']
 
     row_idx = dataIndexArray[i]
@@ -180,159 +203,30 @@ def callback(i, *args):
     newchoice = choices.index(choice_container[i-minl].get())
     data[row_idx] = str(newchoice)
 
-    # Find quest in cache
-    quest = None
-    for q in quest_cache:
-        if q['row'] == row_idx:
-            quest = q
-            quest['status'] = newchoice  # Update cache
-            break
-
+    quest = findQuest(row_idx)
     if not quest:
         return
+    quest['status'] = newchoice  # Update cache
 
-    locationName = quest['turn_in']
-    curobj = placedata[findLocation(locationName)]
+    #placedata[].array are the counters in location_counts, so only redraw
+    for place in location_counts.change(row_idx, oldchoice, newchoice):
+        setText(placedata[place])
 
-    if(oldchoice != 1): #unobtained, completed, turned in
-        if (newchoice != 1):
-            curobj.array[oldchoice] -= 1
-            curobj.array[newchoice] += 1
-            setText(curobj)
-        else:
-            curobj.array[oldchoice] -= 1
-            # Use cached locations instead of Excel reads
-            for loc_name in quest['locations']:
-                tempobj = placedata[findLocation(loc_name)]
-                tempobj.array[newchoice] += 1
-                setText(tempobj)
-    else:
-        if(newchoice != 1):
-            curobj.array[newchoice] += 1
-            setText(curobj)
-            # Use cached locations instead of Excel reads
-            for loc_name in quest['locations']:
-                tempobj = placedata[findLocation(loc_name)]
-                tempobj.array[oldchoice] -= 1
-                setText(tempobj)
-
-    placedata[allIndex].array[oldchoice] -= 1
-    placedata[allIndex].array[newchoice] += 1
-    setText(placedata[allIndex])
-
-    if quest['life'] is not None:
-        placedata[livesIndex].array[oldchoice] -= 1
-        placedata[livesIndex].array[newchoice] += 1
-        setText(placedata[livesIndex])
-
-    save()
-    
-def goBack(*args):
-    global dataIndexArray
-    global minl
-    global text_frame
-    global text_scroll
-    if(minl - 29) >= 0:
-        minl = minl - 29
-        text_frame.destroy()
-        text_frame = Frame(holdSelf)
-        text_frame.pack_propagate(0)
-        text_frame.config(height=1000, width=1230)
-        text_frame.pack()
-        text_scroll = Scrollbar(text_frame, "Text")
-        showData()
+    progress_log.record(row_idx, newchoice)
     
-def goForward(*args):
-    global dataIndexArray
-    global minl
-    global text_frame
-    global text_scroll
-    tempmaxl = len(dataIndexArray)
-    if(tempmaxl-minl) > 29:
-        minl = minl + 29
-        text_frame.destroy()
-        text_frame = Frame(holdSelf)
-        text_frame.pack_propagate(0)
-        text_frame.config(height=1000, width=1230)
-        text_frame.pack()
-        text_scroll = Scrollbar(text_frame, "Text")
-        showData()
-
 def showData():
-    """Display quest data - now uses cached data for better performance"""
-    global text_scroll, dataIndexArray, choice_container, minl
-    global location_container_outer, quest_cache, wb
-
-    choice_container = []
-    choices = ['Unobtained','Obtained','Completed','Turned In']
-    location_container_outer = []
-
-    ######Labels at the top of the info on right side######
-    for j in range(2,10):
-        if (j != URLCol):
-            tk.Label(text_scroll.frame, text=wb['Sheet1'].cell(row=1, column=j).value).grid(row=0,column=j, sticky='nw')
-    tk.Label(text_scroll.frame, text="Location").grid(row=0,column=10, sticky='nw')
-
-    maxl = len(dataIndexArray)
-    if (maxl-minl) > 29:
-        maxl = minl+29
-
-    for i in range(minl, maxl):
-        row_idx = dataIndexArray[i]
-
-        # Find quest in cache
-        quest = None
-        for q in quest_cache:
-            if q['row'] == row_idx:
-                quest = q
-                break
-
-        if not quest:
-            continue
-
-        # Status dropdown
-        var = StringVar()
-        choice_container.append(var)
-        val = quest['status']
-        choice_container[i-minl].set(choices[val])
-        option = OptionMenu(text_scroll.frame, choice_container[i-minl], *choices)
-        option.grid(row=i+1-minl, column=2)
-        choice_container[i-minl].trace("w", lambda a, b, c, i=i: callback(i))
-
-        # Display quest columns using cached data
-        for j in range(3, 10):
-            if (j != URLCol):
-                if(j == nameCol):
-                    obj=Button(text_scroll.frame, text=quest['name'])
-                    obj.configure(command=lambda i=row_idx: OpenUrl(i))
-                    obj.grid(row=i+1-minl,column=j, sticky='nw')
-                else:
-                    tk.Label(text_scroll.frame, text=quest['columns'][j]).grid(row=i+1-minl,column=j, sticky='nw')
-
-        # Location dropdown - use cached locations
-        if quest['locations']:
-            locationvar = StringVar()
-            locationvar.set(quest['locations'][0])
-            locationoption = OptionMenu(text_scroll.frame, locationvar, *quest['locations'])
-            locationoption.grid(row=i+1-minl, column=10)
-            location_container_outer.append(locationvar)
-            location_container_outer[i-minl].trace("w", lambda a, b, c, i=i: locationcallback(i))
-
-    backb=Button(text_scroll.frame, text="<- Back")
-    backb.configure(command=goBack)
-    backb.grid(row=maxl+1-minl,column=4, sticky='nw')
-
-    forwardb=Button(text_scroll.frame, text="Forward ->")
-    forwardb.configure(command=goForward)
-    forwardb.grid(row=maxl+1-minl,column=5, sticky='nw')
+    """Display quest data - rebinds the quest table's rows, from the top of the list"""
+    global quest_grid
+    quest_grid.show()
 
 def gatherData():
     """Filter and sort quest data - now uses cached data with sorting support"""
     global currentPlaceIndex, topButton, placedata, allIndex, livesIndex
-    global dataIndexArray, minl, quest_cache, current_sort, search_text
+    global dataIndexArray, minl, quest_cache, quest_by_row, sort_orders, current_sort, search_text
 
     dataIndexArray = []
     current_place_name = placedata[currentPlaceIndex].key
+    search_key = search_text.casefold()
 
     # Filter quests based on status and location using cache
     for quest in quest_cache:
@@ -340,7 +234,7 @@ def gatherData():
         status = quest['status']
 
         # Apply search filter
-        if search_text and search_text.lower() not in quest['name'].lower():
+        if search_key and search_key not in quest['name_key']:
             continue
 
         # Apply location and status filters
@@ -379,15 +273,15 @@ def gatherData():
         if include:
             dataIndexArray.append(row_idx)
 
-    # Apply sorting
-    if current_sort == 'name':
-        dataIndexArray.sort(key=lambda idx: next((str(q['name']) if q['name'] else '') for q in quest_cache if q['row'] == idx).lower())
-    elif current_sort == 'life':
-        dataIndexArray.sort(key=lambda idx: next((str(q['life']) if q['life'] else 'zzz') for q in quest_cache if q['row'] == idx).lower())
-    elif current_sort == 'location':
-        dataIndexArray.sort(key=lambda idx: next((str(q['turn_in']) if q['turn_in'] else '') for q in quest_cache if q['row'] == idx).lower())
+    # Apply sorting by walking a precomputed order, keeping only included rows
+    if current_sort in sort_orders:
+        included = set(dataIndexArray)
+        dataIndexArray = [row_idx for row_idx in sort_orders[current_sort] if row_idx in included]
     elif current_sort == 'status':
-        dataIndexArray.sort(key=lambda idx: next(q['status'] for q in quest_cache if q['row'] == idx))
+        buckets = [[], [], [], []]
+        for row_idx in dataIndexArray:
+            buckets[quest_by_row[row_idx]['status']].append(row_idx)
+        dataIndexArray = [row_idx for bucket in buckets for row_idx in bucket]
     # 'default' keeps original order
 
     minl = 0
@@ -395,85 +289,41 @@ def gatherData():
     
 
 def initializeCount():
-    """Initialize quest counters - now uses cached data for better performance"""
-    global placedata, livesIndex, allIndex, quest_cache
+    """Initialize quest counters from the quest x place matrix (see modules/location_counts.py)"""
+    global placedata, livesIndex, allIndex, quest_cache, location_counts, snapshot
 
     #0=unobtained 1=obtained 2=completed 3=turnedin
-    for quest in quest_cache:
-        status = quest['status']
-        placedata[allIndex].array[status] += 1 #all array
-
-        #if it is a Life quest
-        if quest['life'] is not None:
-            placedata[livesIndex].array[status] += 1
-
-        #this covers adding the count to ALL sections except "obtained"
-        if status != 1:
-            locationIndex = findLocation(quest['turn_in'])
-            if locationIndex >= 0:
-                placedata[locationIndex].array[status] += 1
-        else: #"obtained" update goes here
-            for loc_name in quest['locations']:
-                locationIndex = findLocation(loc_name)
-                if locationIndex >= 0:
-                    placedata[locationIndex].array[status] += 1
+    #"obtained" counts at every place a quest is available, the rest at its turn in place
+    location_counts = LocationCounts(len(placedata), allIndex, livesIndex)
+    location_counts.build(quest_cache, *snapshot.place_matrix())
 
     #update the text for all locations
     for j in range(len(placedata)):
+        placedata[j].array = location_counts.counts[j]
         setText(placedata[j])
 
 def topB(v, *args):
     global topButton
-    global text_scroll
-    global text_frame
-    global holdSelf
     topButton = v
     changeTitle()
-    text_frame.destroy()
-    text_frame = Frame(holdSelf)
-    text_frame.pack_propagate(0)
-    text_frame.config(height=1000, width=1230)
-    text_frame.pack()
-    text_scroll = Scrollbar(text_frame, "Text")
     gatherData()
     
 def selectLocation(n, *args):
     global currentPlaceIndex
-    global text_scroll
-    global text_frame
-    global holdSelf
     currentPlaceIndex = n
     changeTitle()
-    text_frame.destroy()
-    text_frame = Frame(holdSelf)
-    text_frame.pack_propagate(0)
-    text_frame.config(height=1000, width=1230)
-    text_frame.pack()
-    text_scroll = Scrollbar(text_frame, "Text")
     gatherData()
 
 def onSortChange(*args):
     """Handle sort dropdown change"""
-    global current_sort, sort_var, text_scroll, text_frame, holdSelf
+    global current_sort, sort_var
     current_sort = sort_var.get().lower()
-    text_frame.destroy()
-    text_frame = Frame(holdSelf)
-    text_frame.pack_propagate(0)
-    text_frame.config(height=1000, width=1230)
-    text_frame.pack()
-    text_scroll = Scrollbar(text_frame, "Text")
     gatherData()
 
 def onSearchChange(*args):
     """Handle search box change"""
-    global search_text, search_var, text_scroll, text_frame, holdSelf
+    global search_text, search_var
     search_text = search_var.get()
-    text_frame.destroy()
-    text_frame = Frame(holdSelf)
-    text_frame.pack_propagate(0)
-    text_frame.config(height=1000, width=1230)
-    text_frame.pack()
-    text_scroll = Scrollbar(text_frame, "Text")
     gatherData()
 
 class ToolTip(object):
@@ -528,13 +378,10 @@ class Location():
 class Scrollbar(tk.Frame):
     def scrollMap(self):
         ####This section is for initializing the left place buttons####
-        fp = open("placenames.txt", "r")
-        placenames = fp.read().splitlines()
-        fp.close()
-        
-        fi = open("imagenames.txt", "r")
-        imagenames = fi.read().splitlines()
-        fi.close()
+        global snapshot
+        places = snapshot.places()
+        placenames = [name for name, _ in places]
+        imagenames = [image for _, image in places]
     
         x = 0
         y = 0
@@ -590,6 +437,189 @@ class Scrollbar(tk.Frame):
     
 
 
+class QuestGrid(tk.Frame):
+    """Virtualized quest table
+
+    Holds a fixed pool of gridRows rows of widgets. Scrolling does not create
+    or destroy widgets; it only rebinds the rows to the quests at
+    dataIndexArray[minl:minl + gridRows].
+    """
+
+    def __init__(self, root):
+        tk.Frame.__init__(self, root)
+        global choice_container, location_container_outer, sheet_header
+        self.top = 0          # dataIndexArray index of the first row
+        self.binding = False  # True while rows are rebound, so traces are ignored
+
+        # Vertical scrolling is virtual; horizontal scrolling moves the table
+        self.vsb = tk.Scrollbar(self, orient="vertical", command=self.onScroll)
+        self.hsb = tk.Scrollbar(self, orient="horizontal")
+        self.canvas = tk.Canvas(self, borderwidth=0, xscrollcommand=self.hsb.set)
+        self.hsb.configure(command=self.canvas.xview)
+        self.frame = tk.Frame(self.canvas)
+        self.hsb.pack(side="bottom", fill="x")
+        self.vsb.pack(side="right", fill="y")
+        self.canvas.pack(side="left", fill="both", expand=True)
+        self.canvas.create_window((4,4), window=self.frame, anchor="nw")
+        self.frame.bind("<Configure>", self.onFrameConfigure)
+
+        ######Labels at the top of the info on right side######
+        for j in range(2,10):
+            if (j != URLCol):
+                tk.Label(self.frame, text=sheet_header.get(j)).grid(row=0,column=j, sticky='nw')
+        tk.Label(self.frame, text="Location").grid(row=0,column=10, sticky='nw')
+
+        self.rows = [self.createRow(k) for k in range(gridRows)]
+        choice_container = [row['status'] for row in self.rows]
+        location_container_outer = [row['location'] for row in self.rows]
+
+        # Mouse wheel scrolls the table while the pointer is over it
+        self.bind_all("<MouseWheel>", self.onWheel)
+        self.bind_all("<Button-4>", self.onWheel)
+        self.bind_all("<Button-5>", self.onWheel)
+
+    def createRow(self, k):
+        """Widgets for one table row, created once and hidden until bound"""
+        choices = ['Unobtained','Obtained','Completed','Turned In']
+        row = {'shown': True}
+
+        row['status'] = StringVar()
+        row['status'].set(choices[0])
+        row['statusMenu'] = OptionMenu(self.frame, row['status'], *choices)
+        row['statusMenu'].grid(row=k+1, column=2)
+        row['status'].trace("w", lambda a, b, c, k=k: self.onStatus(k))
+
+        row['cells'] = {}
+        for j in range(3, 10):
+            if (j != URLCol):
+                if(j == nameCol):
+                    cell = Button(self.frame, command=lambda k=k: self.onName(k))
+                else:
+                    cell = tk.Label(self.frame)
+                cell.grid(row=k+1, column=j, sticky='nw')
+                row['cells'][j] = cell
+
+        row['location'] = StringVar()
+        row['locationMenu'] = OptionMenu(self.frame, row['location'], "")
+        row['locationMenu'].grid(row=k+1, column=10)
+        row['locationShown'] = True
+        row['location'].trace("w", lambda a, b, c, k=k: self.onLocation(k))
+
+        self.hideRow(row)
+        return row
+
+    def hideRow(self, row):
+        if row['shown']:
+            row['statusMenu'].grid_remove()
+            for cell in row['cells'].values():
+                cell.grid_remove()
+            row['shown'] = False
+        self.showLocation(row, False)
+
+    def showLocation(self, row, shown):
+        if row['locationShown'] != shown:
+            if shown:
+                row['locationMenu'].grid()
+            else:
+                row['locationMenu'].grid_remove()
+            row['locationShown'] = shown
+
+    def bindRow(self, row, quest):
+        """Point a row's widgets at a quest"""
+        choices = ['Unobtained','Obtained','Completed','Turned In']
+        row['status'].set(choices[quest['status']])
+        for j, cell in row['cells'].items():
+            text = quest['name'] if j == nameCol else quest['columns'][j]
+            cell.configure(text="" if text is None else text)
+
+        menu = row['locationMenu']['menu']
+        menu.delete(0, 'end')
+        for loc_name in quest['locations']:
+            menu.add_command(label=loc_name, command=tk._setit(row['location'], loc_name))
+        if quest['locations']:
+            row['location'].set(quest['locations'][0])
+
+        if not row['shown']:
+            row['statusMenu'].grid()
+            for cell in row['cells'].values():
+                cell.grid()
+            row['shown'] = True
+        self.showLocation(row, bool(quest['locations']))
+
+    def show(self):
+        """Show dataIndexArray from the top"""
+        self.top = 0
+        self.canvas.xview_moveto(0)
+        self.refresh()
+
+    def refresh(self):
+        """Rebind every row to the quests at the current scroll position"""
+        global dataIndexArray, minl
+        total = len(dataIndexArray)
+        self.top = max(0, min(self.top, total - len(self.rows)))
+        minl = self.top
+
+        self.binding = True
+        try:
+            for k, row in enumerate(self.rows):
+                quest = findQuest(dataIndexArray[self.top + k]) if self.top + k < total else None
+                if quest:
+                    self.bindRow(row, quest)
+                else:
+                    self.hideRow(row)
+        finally:
+            self.binding = False
+
+        if total:
+            self.vsb.set(self.top / total, min(1.0, (self.top + len(self.rows)) / total))
+        else:
+            self.vsb.set(0, 1)
+
+    def scrollTo(self, top):
+        global dataIndexArray
+        top = max(0, min(top, len(dataIndexArray) - len(self.rows)))
+        if top != self.top:
+            self.top = top
+            self.refresh()
+
+    def onScroll(self, *args):
+        """Scrollbar command: ('moveto', fraction) or ('scroll', n, 'units'/'pages')"""
+        global dataIndexArray
+        if args[0] == 'moveto':
+            self.scrollTo(int(float(args[1]) * len(dataIndexArray)))
+        elif args[0] == 'scroll':
+            step = int(args[1])
+            if args[2] == 'pages':
+                step *= len(self.rows) - 1
+            self.scrollTo(self.top + step)
+
+    def onWheel(self, event):
+        widget = self.winfo_containing(event.x_root, event.y_root)
+        if widget is None or not str(widget).startswith(str(self)):
+            return
+        if event.num == 5 or event.delta < 0:
+            self.scrollTo(self.top + 3)
+        elif event.num == 4 or event.delta > 0:
+            self.scrollTo(self.top - 3)
+
+    def onStatus(self, k):
+        if not self.binding:
+            callback(self.top + k)
+
+    def onLocation(self, k):
+        if not self.binding:
+            locationcallback(self.top + k)
+
+    def onName(self, k):
+        global dataIndexArray
+        if self.top + k < len(dataIndexArray):
+            OpenUrl(dataIndexArray[self.top + k])
+
+    def onFrameConfigure(self, event):
+        '''Reset the scroll region to encompass the inner frame'''
+        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+
+
 class Window(Scrollbar):
     def __init__(self, master=None):
         Frame.__init__(self, master)               
@@ -629,8 +659,9 @@ class Window(Scrollbar):
         text_frame.config(height=1000, width=1230)
         text_frame.pack()
 
-        global text_scroll
-        text_scroll = Scrollbar(text_frame, "Text")
+        global quest_grid
+        quest_grid = QuestGrid(text_frame)
+        quest_grid.pack(fill=BOTH, expand=1)
         changeTitle()
         gatherData()
 
@@ -668,7 +699,8 @@ class Window(Scrollbar):
         
         
     def client_exit(self):
-        wb.close()
+        save()
+        snapshot.close()
         exit() 
 
 ###############MAIN##################
@@ -688,8 +720,8 @@ save()
 
 
 try:
-    global wb
-    wb = load_workbook('FLData.xlsx')
+    # Compiled quest data; only rebuilt (with openpyxl) when FLData.xlsx changed
+    snapshot = QuestSnapshot(ensure_snapshot())
 except FileNotFoundError:
     print("ERROR")
     sys.exit()
@@ -707,4 +739,5 @@ root.iconbitmap(r'Images/icon.ico')
 app = Window(root)
 
 root.mainloop()
-wb.close()
\ No newline at end of file
+save()
+snapshot.close()
\ No newline at end of file
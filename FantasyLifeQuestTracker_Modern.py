@@ -20,307 +20,539 @@ import customtkinter as ctk
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import sqlite3
-import json
-import webbrowser
 import os
+import time
 from datetime import datetime
-from openpyxl import load_workbook
 
 # Set appearance
 ctk.set_appearance_mode("dark")
 ctk.set_default_color_theme("blue")
 
+# Queued edits are committed once the user pauses for FLUSH_IDLE_MS, and
+# never later than FLUSH_MAX_DELAY_MS after the first unsaved edit
+FLUSH_IDLE_MS = 300
+FLUSH_MAX_DELAY_MS = 2000
+
+# Ids per UPDATE ... WHERE row_id IN (...) statement; stays below SQLite's
+# historic limit of 999 bound parameters
+UPDATE_CHUNK_SIZE = 500
+
+# Staged startup: the window is shown empty and then filled a chunk per
+# event-loop turn, so it paints before all the data is in place
+STARTUP_TREE_CHUNK = 200      # Quests added to the tree per turn
+STARTUP_PROGRESS_CHUNK = 3    # Life progress widgets created per turn
+IMPORT_POLL_MS = 50           # How often the first-run import reports progress
+
+# Regional maps shown in the details panel (the map GIFs are 5:3)
+REGION_MAP_SIZE = (380, 228)
+
 class QuestDatabase:
     """SQLite database manager for quest data, notes, and tags"""
 
-    def __init__(self, db_path="quest_tracker.db"):
+    def __init__(self, db_path="quest_tracker.db", journal_path=None):
         self.db_path = db_path
         self.conn = None
+        self.quest_index = None  # Built on first use, see get_quest_index()
+
+        # Write-behind queue: edits are journaled and applied to the quest
+        # index at once, then committed together by flush(). Connections
+        # open at the same time need journals of their own
+        from modules.write_journal import WriteJournal
+        self.journal = WriteJournal(journal_path or db_path + ".pending")
+        self.pending = []         # Queued mutations, oldest first
+        self.pending_notes = {}   # quest_id -> note not yet committed
+        self.pending_tags = {}    # quest_id -> tags not yet committed
+
         self.init_database()
+        self.replay_journal()
 
     def init_database(self):
-        """Initialize database with tables"""
+        """Open the database and bring its schema up to date"""
         self.conn = sqlite3.connect(self.db_path)
         self.conn.row_factory = sqlite3.Row
         cursor = self.conn.cursor()
 
-        # Quest data table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS quests (
-                row_id INTEGER PRIMARY KEY,
-                status INTEGER DEFAULT 0,
-                name TEXT,
-                life TEXT,
-                rank TEXT,        -- Quest rank (Novice, Apprentice, Master, etc.)
-                giver TEXT,       -- NPC/Quest Giver name
-                description TEXT,
-                turn_in TEXT,
-                url TEXT,
-                last_modified TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-
-        # Quest locations (many-to-many)
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS quest_locations (
-                quest_id INTEGER,
-                location TEXT,
-                FOREIGN KEY (quest_id) REFERENCES quests(row_id)
-            )
-        ''')
-
-        # Quest notes
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS quest_notes (
-                quest_id INTEGER PRIMARY KEY,
-                note TEXT,
-                FOREIGN KEY (quest_id) REFERENCES quests(row_id)
-            )
-        ''')
-
-        # Quest tags
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS quest_tags (
-                quest_id INTEGER,
-                tag TEXT,
-                FOREIGN KEY (quest_id) REFERENCES quests(row_id)
-            )
-        ''')
-
-        # Statistics
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS statistics (
-                date TEXT PRIMARY KEY,
-                completed_count INTEGER DEFAULT 0,
-                turned_in_count INTEGER DEFAULT 0
-            )
-        ''')
+        # WAL: commits append to the log instead of rewriting pages, and with
+        # synchronous=NORMAL they only reach the disk at checkpoints
+        cursor.execute('PRAGMA journal_mode=WAL')
+        cursor.execute('PRAGMA synchronous=NORMAL')
+
+        # Create or upgrade the schema (see modules/migrations.py)
+        from modules.migrations import ensure_search_index, migrate, register_functions
+        migrate(self.conn)
+        register_functions(self.conn)
+
+        # Full-text search over quest text and notes; None when SQLite was
+        # built without FTS5 and searches use the LIKE-style path
+        self.search_tokenizer = ensure_search_index(self.conn)
+
+    def replay_journal(self):
+        """Commit edits left in the journal by a run that did not flush"""
+        entries = self.journal.replay()
+        if entries:
+            print(f"Replaying {len(entries)} unsaved change(s) from {self.journal.path}")
+            self.pending = entries
+            self.flush()
+
+    def _queue(self, entry):
+        """Journal a mutation and hold it for the next flush()"""
+        self.pending.append(entry)
+        try:
+            self.journal.append(entry)
+        except OSError as e:
+            # Without a replay log, write the change through right away
+            print(f"Warning: Could not write journal: {e}")
+            self.flush()
+
+    def _apply_mutation(self, cursor, entry):
+        """Write one queued mutation (replaying it twice is harmless)"""
+        if entry['op'] == 'status':
+            # One set-based statement per chunk of ids
+            quest_ids = entry['quest_ids']
+            for start in range(0, len(quest_ids), UPDATE_CHUNK_SIZE):
+                chunk = quest_ids[start:start + UPDATE_CHUNK_SIZE]
+                cursor.execute(f'''
+                    UPDATE quests SET status = ?, last_modified = ?
+                    WHERE row_id IN ({', '.join('?' * len(chunk))})
+                ''', [entry['status'], entry['timestamp']] + list(chunk))
+        elif entry['op'] == 'note':
+            cursor.execute('''
+                INSERT OR REPLACE INTO quest_notes (quest_id, note)
+                VALUES (?, ?)
+            ''', (entry['quest_id'], entry['note']))
+        elif entry['op'] == 'tag':
+            cursor.execute('INSERT OR IGNORE INTO quest_tags (quest_id, tag) VALUES (?, ?)',
+                           (entry['quest_id'], entry['tag']))
+
+    def flush(self):
+        """Commit every queued mutation in a single transaction"""
+        if not self.pending:
+            return
 
-        # Create indexes for performance
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_life ON quests(life)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_status ON quests(status)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_rank ON quests(rank)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_giver ON quests(giver)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_location ON quest_locations(location)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_quest_id ON quest_locations(quest_id)')
+        cursor = self.conn.cursor()
+        try:
+            for entry in self.pending:
+                self._apply_mutation(cursor, entry)
+            self.conn.commit()
+        except sqlite3.Error:
+            self.conn.rollback()
+            raise
+
+        self.pending = []
+        self.pending_notes.clear()
+        self.pending_tags.clear()
+        self.journal.reset()
+
+    def import_from_legacy(self, progress_file, excel_file, progress_callback=None):
+        """Import data from old text file + Excel format
+
+        Quest data comes from the compiled snapshot (FLData.snapshot.db),
+        which is rebuilt first if FLData.xlsx changed. If no snapshot can be
+        written the workbook is streamed directly. progress_callback(done,
+        total) is called as rows are read.
+        """
+        from modules.quest_snapshot import ensure_snapshot
+
+        try:
+            snapshot_file = ensure_snapshot(excel_file=excel_file)
+        except (OSError, sqlite3.Error) as e:
+            print(f"Warning: Could not build quest snapshot: {e}")
+            self.import_from_workbook(progress_file, excel_file, progress_callback)
+        else:
+            self.import_from_snapshot(progress_file, snapshot_file, progress_callback)
 
-        self.conn.commit()
+    def import_from_snapshot(self, progress_file, snapshot_file, progress_callback=None):
+        """Import quests from a compiled snapshot plus the progress file"""
+        from modules.quest_snapshot import QuestSnapshot
 
-    def import_from_legacy(self, progress_file, excel_file):
-        """Import data from old text file + Excel format"""
         # Read progress file
         with open(progress_file, 'r') as f:
             data = f.read().splitlines()
 
-        # Load Excel
-        wb = load_workbook(excel_file)
-        sheet = wb['Sheet1']
+        snapshot = QuestSnapshot(snapshot_file)
+        try:
+            quests = [
+                (row['row_id'], int(data[row['row_id']]), row['name'], row['life'], row['rank'],
+                 row['giver'], row['description'], row['turn_in'], row['url'])
+                for row in snapshot.quests() if row['row_id'] < len(data)
+            ]
+            locations = [(quest_id, location) for quest_id, location in snapshot.quest_locations()
+                         if quest_id < len(data)]
+        finally:
+            snapshot.close()
 
-        cursor = self.conn.cursor()
+        if progress_callback:
+            progress_callback(len(quests), len(quests))
+
+        self._write_imported_quests(quests, locations)
 
-        # Import quests
-        for row_idx in range(2, len(data)):
-            status = int(data[row_idx])
-            name = sheet.cell(row=row_idx, column=7).value
-            life = sheet.cell(row=row_idx, column=5).value
-            # Excel: column 4 = NPC, column 6 = Rank
-            # DB: rank column = rank, giver column = NPC
-            giver = sheet.cell(row=row_idx, column=4).value  # NPC from Excel col 4
-            rank = sheet.cell(row=row_idx, column=6).value   # Rank from Excel col 6
-            description = sheet.cell(row=row_idx, column=8).value
-            turn_in = sheet.cell(row=row_idx, column=9).value
-            url = sheet.cell(row=row_idx, column=3).value
+    def import_from_workbook(self, progress_file, excel_file, progress_callback=None):
+        """Import quests by streaming FLData.xlsx (needs openpyxl)
 
+        Streams the workbook row by row and writes everything in a single
+        transaction. progress_callback(done, total) is called as rows are read.
+        """
+        from openpyxl import load_workbook
+
+        # Read progress file
+        with open(progress_file, 'r') as f:
+            data = f.read().splitlines()
+        total = max(len(data) - 2, 0)
+
+        # Stream Excel rows as plain value tuples
+        wb = load_workbook(excel_file, read_only=True, data_only=True)
+        sheet = wb['Sheet1']
+        rows = sheet.iter_rows(values_only=True)
+
+        def cell(values, column):
+            """1-based column lookup that tolerates short rows"""
+            return values[column - 1] if column <= len(values) else None
+
+        # Resolve the location header (columns 10-50) once
+        header = next(rows, ())
+        location_columns = [(col, cell(header, col)) for col in range(10, 51) if cell(header, col)]
+
+        quests = []
+        locations = []
+        try:
+            for row_idx, values in enumerate(rows, start=2):
+                if row_idx >= len(data):
+                    break
+
+                # Excel: column 4 = NPC, column 6 = Rank
+                # DB: rank column = rank, giver column = NPC
+                quests.append((
+                    row_idx,
+                    int(data[row_idx]),   # status
+                    cell(values, 7),      # name
+                    cell(values, 5),      # life
+                    cell(values, 6),      # rank
+                    cell(values, 4),      # giver (NPC)
+                    cell(values, 8),      # description
+                    cell(values, 9),      # turn_in
+                    cell(values, 3)       # url
+                ))
+
+                # Locations where the quest is available
+                for col, location in location_columns:
+                    if cell(values, col) == 1:
+                        locations.append((row_idx, location))
+
+                if progress_callback and (len(quests) % 50 == 0 or len(quests) == total):
+                    progress_callback(len(quests), total)
+        finally:
+            wb.close()
+
+        self._write_imported_quests(quests, locations)
+
+    def _write_imported_quests(self, quests, locations):
+        """Write imported quest and location rows in a single transaction"""
+        self.flush()
+        cursor = self.conn.cursor()
+        try:
+            # Stage rows in a temp table, then copy them with one statement so
+            # the search index triggers run inside a single statement
+            cursor.execute('''
+                CREATE TEMP TABLE IF NOT EXISTS import_quests (
+                    row_id INTEGER PRIMARY KEY, status INTEGER, name TEXT, life TEXT, rank TEXT,
+                    giver TEXT, description TEXT, turn_in TEXT, url TEXT
+                )
+            ''')
+            cursor.execute('DELETE FROM temp.import_quests')
+            cursor.executemany('INSERT INTO temp.import_quests VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)', quests)
             cursor.execute('''
                 INSERT OR REPLACE INTO quests
-                (row_id, status, name, life, rank, giver, description, turn_in, url)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (row_idx, status, name, life, rank, giver, description, turn_in, url))
-
-            # Import locations
-            for col in range(10, 51):
-                if sheet.cell(row=row_idx, column=col).value == 1:
-                    location = sheet.cell(row=1, column=col).value
-                    cursor.execute('''
-                        INSERT INTO quest_locations (quest_id, location)
-                        VALUES (?, ?)
-                    ''', (row_idx, location))
-
-        self.conn.commit()
-        wb.close()
+                (row_id, status, name, life, rank, giver, description, turn_in, url, rank_ord)
+                SELECT row_id, status, name, life, rank, giver, description, turn_in, url,
+                       rank_ordinal(rank)
+                FROM temp.import_quests
+            ''')
+
+            # Re-importing must not duplicate location rows
+            cursor.execute('DELETE FROM quest_locations WHERE quest_id IN (SELECT row_id FROM temp.import_quests)')
+            cursor.execute('DELETE FROM temp.import_quests')
+            cursor.executemany('''
+                INSERT OR IGNORE INTO quest_locations (quest_id, location)
+                VALUES (?, ?)
+            ''', locations)
+
+            # Refresh the planner statistics for the new data
+            cursor.execute('ANALYZE')
+            self.conn.commit()
+        except sqlite3.Error:
+            self.conn.rollback()
+            raise
+
+        # Quest data changed underneath the index
+        self.quest_index = None
+
+    def get_quest_index(self):
+        """Get the in-memory quest index, building it on first use"""
+        if self.quest_index is None:
+            from modules.quest_index import QuestIndex
+            # Queued edits only live in the index being replaced
+            self.flush()
+            self.quest_index = QuestIndex(self.conn)
+        return self.quest_index
 
     def get_all_quests(self, filters=None):
-        """Get all quests with optional filtering"""
-        cursor = self.conn.cursor()
-        query = "SELECT * FROM quests WHERE 1=1"
-        params = []
-
-        if filters:
-            if filters.get('status') is not None and filters['status'] != 'all':
-                query += " AND status = ?"
-                params.append(filters['status'])
-
-            if filters.get('life'):
-                query += " AND life = ?"
-                params.append(filters['life'])
-
-            if filters.get('location'):
-                query += " AND row_id IN (SELECT quest_id FROM quest_locations WHERE location = ?)"
-                params.append(filters['location'])
-
-            if filters.get('search'):
-                search_term = filters['search']
-                search_field = filters.get('search_field', 'Name')
-
-                if search_field == 'All':
-                    # Search across all fields
-                    query += " AND (name LIKE ? OR life LIKE ? OR giver LIKE ? OR description LIKE ?)"
-                    params.extend([f"%{search_term}%"] * 4)
-                elif search_field == 'Name':
-                    query += " AND name LIKE ?"
-                    params.append(f"%{search_term}%")
-                elif search_field == 'Life':
-                    query += " AND life LIKE ?"
-                    params.append(f"%{search_term}%")
-                elif search_field == 'NPC':
-                    query += " AND giver LIKE ?"
-                    params.append(f"%{search_term}%")
-                elif search_field == 'Description':
-                    query += " AND description LIKE ?"
-                    params.append(f"%{search_term}%")
-
-            if filters.get('tag'):
-                query += " AND row_id IN (SELECT quest_id FROM quest_tags WHERE tag = ?)"
-                params.append(filters['tag'])
-
-        if filters and filters.get('sort_by'):
-            sort_by = filters['sort_by']
-            if sort_by == 'rank':
-                # Custom sort order for ranks
-                query += """ ORDER BY CASE rank
-                    WHEN 'Novice' THEN 1
-                    WHEN 'Fledgling' THEN 2
-                    WHEN 'Apprentice' THEN 3
-                    WHEN 'Adept' THEN 4
-                    WHEN 'Expert' THEN 5
-                    WHEN 'Master' THEN 6
-                    WHEN 'Hero' THEN 7
-                    WHEN 'Legend' THEN 8
-                    WHEN 'Demi-Creator' THEN 9
-                    WHEN 'Creator' THEN 10
-                    ELSE 99 END"""
-            else:
-                query += f" ORDER BY {sort_by}"
+        """Get all quests with optional filtering (served from the quest index)"""
+        if filters and filters.get('search'):
+            ranked_ids = self.search_quest_ids(filters['search'], filters.get('search_field', 'Name'))
+            if ranked_ids is not None:
+                filters = dict(filters, search=None, search_ids=ranked_ids)
+        return self.get_quest_index().query(filters)
+
+    def search_quest_ids(self, search_term, search_field='Name'):
+        """Full-text search, returning matching row_ids best match first (bm25)
+
+        Returns None when the search index cannot serve the term, in which
+        case the caller falls back to substring matching.
+        """
+        from modules.quest_index import SEARCH_FIELDS
+
+        # quest_search also indexes notes, which 'All' searches too
+        columns = SEARCH_FIELDS.get(search_field)
+        if search_field == 'All':
+            columns += ('note',)
+        term = search_term.strip()
+        if not self.search_tokenizer or not columns or not term:
+            return None
+
+        # Trigrams need at least three characters to match anything
+        if self.search_tokenizer == 'trigram' and len(term) < 3:
+            return None
+
+        # Notes are searched in SQLite, so commit any that are still queued
+        if self.pending_notes:
+            self.flush()
+
+        phrase = '"' + term.replace('"', '""') + '"'
+        if self.search_tokenizer != 'trigram':
+            phrase += '*'
+        match = "{" + " ".join(columns) + "} : " + phrase
 
-        cursor.execute(query, params)
-        return cursor.fetchall()
+        cursor = self.conn.cursor()
+        cursor.execute('SELECT rowid FROM quest_search WHERE quest_search MATCH ? ORDER BY rank', (match,))
+        return [row[0] for row in cursor.fetchall()]
 
     def update_quest_status(self, quest_id, new_status):
-        """Update quest status"""
-        cursor = self.conn.cursor()
-        cursor.execute('''
-            UPDATE quests SET status = ?, last_modified = ?
-            WHERE row_id = ?
-        ''', (new_status, datetime.now(), quest_id))
-        self.conn.commit()
+        """Update quest status
+
+        Returns a list of (quest, old_status) for the updated quest. The
+        change is committed by the next flush().
+        """
+        timestamp = datetime.now()
+        changes = self.get_quest_index().update_status([quest_id], new_status, timestamp)
+        self._queue({'op': 'status', 'quest_ids': [quest_id], 'status': new_status,
+                     'timestamp': str(timestamp)})
+        return changes
 
     def bulk_update_status(self, quest_ids, new_status):
-        """Update multiple quests at once"""
-        cursor = self.conn.cursor()
-        for qid in quest_ids:
-            cursor.execute('''
-                UPDATE quests SET status = ?, last_modified = ?
-                WHERE row_id = ?
-            ''', (new_status, datetime.now(), qid))
-        self.conn.commit()
+        """Update multiple quests at once, all with the same timestamp
+
+        Returns (changes, histogram): changes lists (quest, old_status) for
+        every updated quest, and histogram maps 'before' and 'after' to the
+        number of those quests in each status. The changes are committed by
+        the next flush() as one set-based UPDATE.
+        """
+        from modules.constants import STATUS_NAMES
+
+        timestamp = datetime.now()
+        changes = self.get_quest_index().update_status(quest_ids, new_status, timestamp)
+        if changes:
+            self._queue({'op': 'status', 'quest_ids': [quest['row_id'] for quest, _ in changes],
+                         'status': new_status, 'timestamp': str(timestamp)})
+
+        before = [0] * len(STATUS_NAMES)
+        for _, old_status in changes:
+            before[old_status] += 1
+        after = [0] * len(STATUS_NAMES)
+        after[new_status] = len(changes)
+        return changes, {'before': before, 'after': after}
 
     def add_note(self, quest_id, note):
-        """Add/update note for a quest"""
-        cursor = self.conn.cursor()
-        cursor.execute('''
-            INSERT OR REPLACE INTO quest_notes (quest_id, note)
-            VALUES (?, ?)
-        ''', (quest_id, note))
-        self.conn.commit()
+        """Add/update note for a quest (committed by the next flush())"""
+        self.pending_notes[quest_id] = note
+        self._queue({'op': 'note', 'quest_id': quest_id, 'note': note})
 
     def get_note(self, quest_id):
         """Get note for a quest"""
+        if quest_id in self.pending_notes:
+            return self.pending_notes[quest_id]
+
         cursor = self.conn.cursor()
         cursor.execute('SELECT note FROM quest_notes WHERE quest_id = ?', (quest_id,))
         result = cursor.fetchone()
         return result['note'] if result else ""
 
     def add_tag(self, quest_id, tag):
-        """Add tag to quest"""
-        cursor = self.conn.cursor()
-        cursor.execute('INSERT INTO quest_tags (quest_id, tag) VALUES (?, ?)', (quest_id, tag))
-        self.conn.commit()
+        """Add tag to quest (committed by the next flush())"""
+        self.get_quest_index().add_tag(quest_id, tag)
+        self.pending_tags.setdefault(quest_id, []).append(tag)
+        self._queue({'op': 'tag', 'quest_id': quest_id, 'tag': tag})
 
     def get_tags(self, quest_id):
         """Get all tags for a quest"""
         cursor = self.conn.cursor()
         cursor.execute('SELECT tag FROM quest_tags WHERE quest_id = ?', (quest_id,))
-        return [row['tag'] for row in cursor.fetchall()]
+        tags = [row['tag'] for row in cursor.fetchall()]
+        for tag in self.pending_tags.get(quest_id, []):
+            if tag not in tags:
+                tags.append(tag)
+        return tags
 
     def get_statistics(self):
         """Get completion statistics"""
-        cursor = self.conn.cursor()
-        stats = {
-            'total': 0,
-            'unobtained': 0,
-            'obtained': 0,
-            'completed': 0,
-            'turned_in': 0
+        unobtained, obtained, completed, turned_in = self.get_quest_index().status_counts()
+        return {
+            'total': unobtained + obtained + completed + turned_in,
+            'unobtained': unobtained,
+            'obtained': obtained,
+            'completed': completed,
+            'turned_in': turned_in
         }
 
-        cursor.execute('SELECT status, COUNT(*) as count FROM quests GROUP BY status')
-        for row in cursor.fetchall():
-            stats['total'] += row['count']
-            if row['status'] == 0:
-                stats['unobtained'] = row['count']
-            elif row['status'] == 1:
-                stats['obtained'] = row['count']
-            elif row['status'] == 2:
-                stats['completed'] = row['count']
-            elif row['status'] == 3:
-                stats['turned_in'] = row['count']
-
-        return stats
-
     def get_life_quest_count(self, life_name):
         """Get total quest count for a specific Life"""
-        cursor = self.conn.cursor()
-        cursor.execute('SELECT COUNT(*) as count FROM quests WHERE life = ?', (life_name,))
-        result = cursor.fetchone()
-        return result['count'] if result else 0
+        return self.get_quest_index().count({'life': life_name})
 
     def get_location_quest_count(self, location_name):
         """Get total quest count for a specific location"""
+        return self.get_quest_index().location_count(location_name)
+
+    def export_to_json(self, filename, ndjson=None, compress=None):
+        """Export all data to JSON
+
+        Quests are streamed to the file as they are read. A .ndjson/.jsonl
+        name writes one quest per line, and a .gz suffix compresses the
+        output (ndjson and compress override the file name). Returns the
+        number of quests written.
+        """
+        from modules.quest_io import export_quests
+
+        self.flush()
+        return export_quests(self.conn, filename, ndjson, compress)
+
+    def import_from_json(self, filename, mode='merge'):
+        """Apply statuses, notes and tags from an export_to_json file
+
+        The file (JSON or NDJSON, optionally gzipped) is streamed one quest
+        at a time. In 'merge' mode a quest's status is taken from the file
+        only if its last_modified is newer than ours (last writer wins);
+        its note is taken if it is newer or we have none, and its tags are
+        added to ours. In 'replace' mode the file's status, note and tags
+        overwrite ours for every quest it lists. A quest without a
+        last_modified keeps our timestamp, or gets the import time if a
+        replace changes its status. All changes are written in one
+        transaction and through to the quest index.
+
+        Returns a dict counting the quests read and skipped (malformed or
+        unknown row_id) and the statuses, notes and tag sets changed.
+        """
+        from modules.quest_io import iter_quest_records, validate_quest
+
+        if mode not in ('merge', 'replace'):
+            raise ValueError(f"Unknown import mode: {mode}")
+
+        self.flush()
+        index = self.get_quest_index()
         cursor = self.conn.cursor()
-        if location_name == "All":
-            cursor.execute('SELECT COUNT(DISTINCT quest_id) as count FROM quest_locations')
-        else:
-            cursor.execute('SELECT COUNT(DISTINCT quest_id) as count FROM quest_locations WHERE location = ?', (location_name,))
-        result = cursor.fetchone()
-        return result['count'] if result else 0
-
-    def export_to_json(self, filename):
-        """Export all data to JSON"""
-        cursor = self.conn.cursor()
-        cursor.execute('SELECT * FROM quests')
-        quests = [dict(row) for row in cursor.fetchall()]
-
-        # Add notes and tags
-        for quest in quests:
-            quest['note'] = self.get_note(quest['row_id'])
-            quest['tags'] = self.get_tags(quest['row_id'])
 
-        with open(filename, 'w') as f:
-            json.dump(quests, f, indent=2, default=str)
+        cursor.execute('SELECT quest_id, note FROM quest_notes')
+        local_notes = dict(cursor.fetchall())
+        local_tags = {}
+        cursor.execute('SELECT quest_id, tag FROM quest_tags')
+        for quest_id, tag in cursor.fetchall():
+            local_tags.setdefault(quest_id, []).append(tag)
+
+        summary = {'read': 0, 'skipped': 0, 'statuses': 0, 'notes': 0, 'tags': 0}
+        imported_at = str(datetime.now())
+        status_rows = []
+        note_rows = []
+        note_deletes = []
+        tag_clears = []
+        tag_rows = []
+
+        for record in iter_quest_records(filename):
+            summary['read'] += 1
+            local = index.get(record['row_id']) if validate_quest(record) is None else None
+            if local is None:
+                summary['skipped'] += 1
+                continue
+
+            quest_id = record['row_id']
+            status = record.get('status')
+            last_modified = record.get('last_modified')
+            if last_modified is None:
+                # Without a timestamp a merge keeps ours; a replace that
+                # changes the status stamps it with the import time
+                changed = mode == 'replace' and status is not None and status != local['status']
+                last_modified = imported_at if changed else local['last_modified']
+            newer = last_modified is not None and (
+                local['last_modified'] is None or last_modified > str(local['last_modified']))
+            wins = mode == 'replace' or newer
+
+            if wins and status is not None and \
+                    (status != local['status'] or last_modified != local['last_modified']):
+                status_rows.append((status, last_modified, quest_id))
+
+            note = record.get('note')
+            local_note = local_notes.get(quest_id)
+            if note and note != local_note and (wins or not local_note):
+                note_rows.append((quest_id, note))
+            elif mode == 'replace' and note == "" and local_note is not None:
+                note_deletes.append((quest_id,))
+
+            tags = record.get('tags')
+            if tags is not None:
+                current = local_tags.get(quest_id, [])
+                if mode == 'replace':
+                    wanted = list(dict.fromkeys(tags))
+                    if set(wanted) != set(current):
+                        tag_clears.append((quest_id,))
+                        tag_rows.extend((quest_id, tag) for tag in wanted)
+                        summary['tags'] += 1
+                else:
+                    added = [tag for tag in dict.fromkeys(tags) if tag not in current]
+                    if added:
+                        tag_rows.extend((quest_id, tag) for tag in added)
+                        summary['tags'] += 1
+
+        try:
+            cursor.executemany('UPDATE quests SET status = ?, last_modified = ? WHERE row_id = ?', status_rows)
+            cursor.executemany('INSERT OR REPLACE INTO quest_notes (quest_id, note) VALUES (?, ?)', note_rows)
+            cursor.executemany('DELETE FROM quest_notes WHERE quest_id = ?', note_deletes)
+            cursor.executemany('DELETE FROM quest_tags WHERE quest_id = ?', tag_clears)
+            cursor.executemany('INSERT OR IGNORE INTO quest_tags (quest_id, tag) VALUES (?, ?)', tag_rows)
+            self.conn.commit()
+        except sqlite3.Error:
+            self.conn.rollback()
+            raise
+
+        summary['statuses'] = len(status_rows)
+        summary['notes'] = len(note_rows) + len(note_deletes)
+
+        # Write the statuses through, oldest timestamp first so most
+        # updates only move quests to the end of the last_modified order
+        by_timestamp = {}
+        for status, last_modified, quest_id in status_rows:
+            by_timestamp.setdefault((str(last_modified), status), []).append(quest_id)
+        for (last_modified, status), quest_ids in sorted(by_timestamp.items()):
+            index.update_status(quest_ids, status, last_modified)
+
+        # Tags changed underneath the index
+        if tag_rows or tag_clears:
+            self.quest_index = None
+        return summary
 
     def close(self):
-        """Close database connection"""
+        """Commit queued edits and close database connection"""
         if self.conn:
+            self.flush()
+            # Refreshes planner statistics only if they have gone stale
+            self.conn.execute('PRAGMA optimize')
+            self.journal.close()
             self.conn.close()
 
 
@@ -329,28 +561,19 @@ class ModernQuestTracker(ctk.CTk):
 
     def __init__(self):
         super().__init__()
+        self.startup_started = time.perf_counter()
+        self.startup_timings = {}  # startup stage -> ms since __init__ began
 
         self.title("Fantasy Life Quest Tracker - Modern Edition")
         self.geometry("1600x900")
 
-        # Initialize database
+        # Initialize database (quests are imported/loaded once the window shows)
         self.db = QuestDatabase()
 
-        # Check if database is empty and needs import
-        cursor = self.db.conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM quests")
-        quest_count = cursor.fetchone()[0]
-
-        if quest_count == 0:
-            if os.path.exists("currentprogress.txt") and os.path.exists("FLData.xlsx"):
-                print("Database is empty. Importing quests from legacy files...")
-                messagebox.showinfo("First Run", "Importing quest data from FLData.xlsx and currentprogress.txt...\n\nThis may take a moment.")
-                self.db.import_from_legacy("currentprogress.txt", "FLData.xlsx")
-                print("Import complete! Loaded 1296 quests.")
-                messagebox.showinfo("Import Complete", "Successfully imported 1296 quests!")
-            else:
-                messagebox.showerror("Missing Files", "Could not find currentprogress.txt or FLData.xlsx.\n\nPlease ensure these files are in the same directory as the tracker.")
-                print("ERROR: Missing currentprogress.txt or FLData.xlsx")
+        # Location thumbnails and regional maps, decoded off the Tk thread
+        from modules.image_manager import ImageManager
+        self.image_manager = ImageManager()
+        self.shown_place_image = None   # (name, is_region) wanted in the details panel
 
         # State
         self.selected_quests = set()
@@ -358,14 +581,156 @@ class ModernQuestTracker(ctk.CTk):
         self.current_filters = {}
         self.current_life_filter = None
         self.current_location_filter = None
-
-        # Setup UI
+        self.current_region_filter = None
+        self.progress_widgets = {}  # life -> progress bar/label and the values they show
+        self.progress_update_job = None
+        self.flush_idle_job = None      # Pending write-behind flush timers
+        self.flush_deadline_job = None
+        self.data_ready = False         # Quests imported and indexed
+        self.progress_tracker = None    # Created once the data is ready
+        self.populate_job = None        # Next chunk of the staged tree fill
+        self.import_results = None      # Queue fed by the first-run import thread
+        self.life_buttons = {}          # life -> (filter button, icon)
+        self.location_buttons = {}      # location -> filter button
+        self.region_buttons = {}        # region -> filter button
+
+        # Setup UI (an empty shell, filled in by start_loading)
         self.setup_ui()
-        self.load_quests()
 
         # Keyboard shortcuts
         self.bind_shortcuts()
 
+        # Load data as soon as the window is on screen
+        self.bind("<Map>", self.on_first_map)
+
+    def mark_startup(self, stage):
+        """Record when a startup stage finished"""
+        if stage not in self.startup_timings:
+            self.startup_timings[stage] = (time.perf_counter() - self.startup_started) * 1000
+
+    def on_first_map(self, event):
+        """The window shell is visible: report first paint and start loading"""
+        if event.widget is not self or 'first_paint' in self.startup_timings:
+            return
+        self.mark_startup('first_paint')
+        # Let the shell finish drawing before doing any real work
+        self.after(10, self.start_loading)
+
+    def start_loading(self):
+        """Startup stage 1: import quest data on first run, in the background"""
+        cursor = self.db.conn.cursor()
+        cursor.execute("SELECT COUNT(*) FROM quests")
+        if cursor.fetchone()[0] > 0:
+            self.load_data()
+            return
+
+        if not (os.path.exists("currentprogress.txt") and os.path.exists("FLData.xlsx")):
+            messagebox.showerror("Missing Files", "Could not find currentprogress.txt or FLData.xlsx.\n\nPlease ensure these files are in the same directory as the tracker.")
+            print("ERROR: Missing currentprogress.txt or FLData.xlsx")
+            self.load_data()
+            return
+
+        import queue
+        import threading
+
+        print("Database is empty. Importing quests from legacy files...")
+        self.show_loading_overlay("Importing quest data from FLData.xlsx and currentprogress.txt...")
+        self.import_results = queue.Queue()
+        threading.Thread(target=self.run_first_import, name="first-run-import", daemon=True).start()
+        self.after(IMPORT_POLL_MS, self.poll_first_import)
+
+    def run_first_import(self):
+        """Worker thread: run the legacy import on a connection of its own"""
+        db = None
+        try:
+            db = QuestDatabase(self.db.db_path, self.db.db_path + ".import.pending")
+            db.import_from_legacy(
+                "currentprogress.txt", "FLData.xlsx",
+                lambda done, total: self.import_results.put(('progress', done, total))
+            )
+            db.close()
+            db = None
+            self.import_results.put(('done', None, None))
+        except Exception as e:
+            self.import_results.put(('error', e, None))
+        finally:
+            if db is not None:
+                db.close()
+
+    def poll_first_import(self):
+        """Tk thread: show import progress and continue once it finishes"""
+        import queue
+
+        while True:
+            try:
+                kind, value, total = self.import_results.get_nowait()
+            except queue.Empty:
+                break
+
+            if kind == 'progress':
+                if self.loading_bar.cget("mode") != "determinate":
+                    self.loading_bar.stop()
+                    self.loading_bar.configure(mode="determinate")
+                self.loading_bar.set(value / total if total else 1)
+                continue
+
+            self.hide_loading_overlay()
+            self.import_results = None
+            if kind == 'error':
+                print(f"ERROR: Import failed: {value}")
+                messagebox.showerror("Import Failed", f"Could not import quest data:\n\n{value}")
+            self.mark_startup('imported')
+            self.load_data()
+            if kind == 'done':
+                print(f"Import complete! Loaded {self.db.get_quest_index().count()} quests.")
+            return
+
+        self.after(IMPORT_POLL_MS, self.poll_first_import)
+
+    def show_loading_overlay(self, message):
+        """Centered message with a progress bar, shown over the window shell"""
+        self.loading_overlay = ctk.CTkFrame(self, corner_radius=10)
+        ctk.CTkLabel(self.loading_overlay, text=message, font=("Arial", 14)).pack(padx=30, pady=(20, 10))
+        self.loading_bar = ctk.CTkProgressBar(self.loading_overlay, width=400, mode="indeterminate")
+        self.loading_bar.pack(padx=30, pady=(0, 20))
+        self.loading_bar.start()
+        self.loading_overlay.place(relx=0.5, rely=0.5, anchor="center")
+
+    def hide_loading_overlay(self):
+        self.loading_bar.stop()
+        self.loading_overlay.destroy()
+        self.loading_overlay = None
+        self.loading_bar = None
+
+    def load_data(self):
+        """Startup stage 2: index the quests, then fill the UI a chunk at a time"""
+        from modules.constants import LIVES
+        from modules.progress_tracker import ProgressTracker
+
+        self.db.get_quest_index()
+        self.progress_tracker = ProgressTracker(self.db)
+        self.data_ready = True
+        self.mark_startup('data_ready')
+
+        self.update_life_counts()
+        self.update_location_counts()
+        self.load_quests(staged=True)
+        self.after(1, self.add_progress_widgets, list(LIVES))
+
+    def finish_startup_stage(self, stage):
+        """Mark a fill stage done and report once the whole window is filled"""
+        if stage in self.startup_timings:
+            return
+        self.mark_startup(stage)
+        if 'tree_filled' in self.startup_timings and 'progress_filled' in self.startup_timings:
+            timings = self.startup_timings
+            report = f"Startup: first paint {timings['first_paint']:.0f} ms"
+            if 'imported' in timings:
+                report += f", first-run import done {timings['imported']:.0f} ms"
+            report += (f", data ready {timings['data_ready']:.0f} ms"
+                       f", fully loaded {max(timings['tree_filled'], timings['progress_filled']):.0f} ms")
+            print(report)
+
     def setup_ui(self):
         """Setup the UI layout"""
 
@@ -379,7 +744,7 @@ class ModernQuestTracker(ctk.CTk):
         file_menu.add_command(label="Export Data...", command=self.export_data, accelerator="Ctrl+E")
         file_menu.add_command(label="Import Data...", command=self.import_data)
         file_menu.add_separator()
-        file_menu.add_command(label="Exit", command=self.quit)
+        file_menu.add_command(label="Exit", command=self.on_closing)
 
         # View menu
         view_menu = tk.Menu(menubar, tearoff=0)
@@ -448,7 +813,7 @@ class ModernQuestTracker(ctk.CTk):
         self.sort_dropdown = ctk.CTkOptionMenu(
             row1,
             variable=self.sort_var,
-            values=["name", "life", "rank", "status", "last_modified"],
+            values=["name", "life", "rank", "status", "last_modified", "relevance"],
             command=self.on_sort_change,
             width=120
         )
@@ -490,8 +855,11 @@ class ModernQuestTracker(ctk.CTk):
         self.left_sidebar.pack(side="left", fill="y", padx=(0, 5))
         self.left_sidebar.pack_propagate(False)
 
-        # Create Life filter panel
-        self.create_life_filter_panel(self.left_sidebar)
+        # Life and Location filter panels, as tabs
+        filter_tabs = ctk.CTkTabview(self.left_sidebar)
+        filter_tabs.pack(fill="both", expand=True)
+        self.create_life_filter_panel(filter_tabs.add("Lives"))
+        self.create_location_filter_panel(filter_tabs.add("Locations"))
 
         # Center panel - Quest list
         center_panel = ctk.CTkFrame(content)
@@ -536,6 +904,10 @@ class ModernQuestTracker(ctk.CTk):
 
         self.tree = ttk.Treeview(table_frame, columns=columns, show="headings", selectmode="extended")
 
+        # Reconciling view layer (configures the status_N row colors once)
+        from modules.tree_view import QuestTreeView
+        self.tree_view = QuestTreeView(self.tree)
+
         # Column headers
         for col in columns:
             self.tree.heading(col, text=col)
@@ -582,6 +954,9 @@ class ModernQuestTracker(ctk.CTk):
 
         ctk.CTkLabel(right_panel, text="Quest Details", font=("Arial", 16, "bold")).pack(pady=10)
 
+        # Turn-in location thumbnail or selected region's map (packed once shown)
+        self.place_image_label = ctk.CTkLabel(right_panel, text="")
+
         # Details display (read-only)
         self.details_text = ctk.CTkTextbox(right_panel, height=300, wrap="word")
         self.details_text.pack(fill="both", expand=True, padx=10, pady=5)
@@ -650,12 +1025,11 @@ class ModernQuestTracker(ctk.CTk):
         scrollable_frame = ctk.CTkScrollableFrame(parent, label_text="")
         scrollable_frame.pack(fill="both", expand=True, padx=5, pady=5)
 
-        # Individual Life buttons with quest counts
+        # Individual Life buttons (quest counts are added by update_life_counts)
         for life_name, icon in LIVES:
-            count = self.db.get_life_quest_count(life_name)
             btn = ctk.CTkButton(
                 scrollable_frame,
-                text=f"{icon} {life_name} ({count})",
+                text=f"{icon} {life_name}",
                 command=lambda l=life_name: self.filter_by_life(l),
                 anchor="w",
                 height=40,
@@ -663,22 +1037,149 @@ class ModernQuestTracker(ctk.CTk):
                 hover_color=("gray70", "gray30")
             )
             btn.pack(fill="x", pady=2)
+            self.life_buttons[life_name] = (btn, icon)
+
+    def update_life_counts(self):
+        """Show the quest count of each Life on its filter button"""
+        for life_name, (btn, icon) in self.life_buttons.items():
+            count = self.db.get_life_quest_count(life_name)
+            btn.configure(text=f"{icon} {life_name} ({count})")
 
     def filter_by_life(self, life_name):
         """Filter quests by Life"""
         self.current_life_filter = life_name
         self.load_quests()
 
+    def create_location_filter_panel(self, parent):
+        """Create the location browser: each region followed by its locations"""
+        from modules.region_mapping import REGION_LOCATION_MAP
 
-    def create_progress_panel(self, parent):
-        """Create bottom panel with Life progress bars"""
-        from modules.constants import LIVES
-        from modules.progress_tracker import ProgressTracker
+        # Header
+        header = ctk.CTkLabel(parent, text="Filter by Location", font=("Arial", 16, "bold"))
+        header.pack(pady=(10, 5))
+
+        # All Locations button
+        all_btn = ctk.CTkButton(
+            parent,
+            text="All Locations",
+            command=lambda: self.filter_by_location(None),
+            height=40,
+            fg_color=("#3b8ed0", "#1f6aa5"),
+            hover_color=("#36719f", "#144870")
+        )
+        all_btn.pack(fill="x", padx=10, pady=5)
+
+        scrollable_frame = ctk.CTkScrollableFrame(parent, label_text="")
+        scrollable_frame.pack(fill="both", expand=True, padx=5, pady=5)
 
-        # Initialize progress tracker
-        if not hasattr(self, 'progress_tracker'):
-            self.progress_tracker = ProgressTracker(self.db)
+        # Region and location buttons (counts are added by update_location_counts,
+        # which also hides the ones without quests)
+        for region, locations in REGION_LOCATION_MAP.items():
+            btn = ctk.CTkButton(
+                scrollable_frame,
+                text=region,
+                command=lambda r=region: self.filter_by_region(r),
+                anchor="w",
+                height=34,
+                font=("Arial", 13, "bold"),
+                fg_color=("gray70", "gray30"),
+                hover_color=("gray65", "gray35")
+            )
+            btn.pack(fill="x", pady=(6, 2))
+            self.region_buttons[region] = btn
+
+            for location in locations:
+                if location == "All":
+                    continue  # Same as the All Locations button
+                btn = ctk.CTkButton(
+                    scrollable_frame,
+                    text=location,
+                    command=lambda l=location: self.filter_by_location(l),
+                    anchor="w",
+                    height=28,
+                    fg_color=("gray75", "gray25"),
+                    hover_color=("gray70", "gray30")
+                )
+                btn.pack(fill="x", padx=(15, 0), pady=1)
+                self.location_buttons[location] = btn
+
+    def update_location_counts(self, locations=None, regions=None):
+        """Show done/total counts on the location browser buttons (default: all of them)"""
+        index = self.db.get_quest_index()
+        for location in (self.location_buttons if locations is None else locations):
+            if location in self.location_buttons:
+                counts = index.place_status_counts(location)
+                self.set_place_count(self.location_buttons[location], location, counts)
+        for region in (self.region_buttons if regions is None else regions):
+            if region in self.region_buttons:
+                counts = index.region_status_counts(region)
+                self.set_place_count(self.region_buttons[region], region, counts)
+
+    def set_place_count(self, btn, name, counts):
+        """Relabel a location browser button, hiding it if no quest is there
+
+        A place's quests never change after loading, so a hidden button
+        does not come back.
+        """
+        if sum(counts):
+            btn.configure(text=self.place_count_text(name, counts))
+        else:
+            btn.pack_forget()
 
+    def place_count_text(self, name, counts):
+        """Button text with the completed (or turned in) and total quest counts"""
+        return f"{name} ({counts[2] + counts[3]}/{sum(counts)})"
+
+    def filter_by_location(self, location_name):
+        """Filter quests by location (None shows every location)"""
+        self.current_location_filter = location_name
+        self.current_region_filter = None
+        self.load_quests()
+        self.show_place_image(location_name)
+
+    def filter_by_region(self, region_name):
+        """Filter quests by region"""
+        self.current_region_filter = region_name
+        self.current_location_filter = None
+        self.load_quests()
+        self.show_place_image(region_name, region=True)
+        # Its locations are likely picked next: decode their thumbnails now
+        self.image_manager.prefetch_region(self, region_name)
+
+    def show_place_image(self, name, region=False):
+        """Show a location thumbnail (or a region's map) above the quest details
+
+        The image is decoded in the background; a placeholder is shown
+        until it arrives. A name of None hides the image.
+        """
+        wanted = (name, region) if name else None
+        self.shown_place_image = wanted
+
+        def deliver(image):
+            # Only if nothing else was selected while this one loaded
+            if self.shown_place_image == wanted:
+                self.set_place_image(image)
+
+        if wanted is None:
+            image = None
+        elif region:
+            image = self.image_manager.get_regional_map_async(self, name, deliver, size=REGION_MAP_SIZE)
+        else:
+            image = self.image_manager.get_location_image_async(self, name, deliver)
+        self.set_place_image(image)
+
+    def set_place_image(self, image):
+        """Put an image in the details panel, hiding the label for None"""
+        if image is None:
+            self.place_image_label.pack_forget()
+            return
+        self.place_image_label.configure(image=image)
+        if not self.place_image_label.winfo_manager():
+            self.place_image_label.pack(before=self.details_text, pady=(0, 5))
+
+
+    def create_progress_panel(self, parent):
+        """Create bottom panel for the Life progress bars (added by add_progress_widgets)"""
         # Header with collapse button
         header_frame = ctk.CTkFrame(parent, height=30)
         header_frame.pack(fill="x", pady=(5, 0))
@@ -688,12 +1189,18 @@ class ModernQuestTracker(ctk.CTk):
         header_label.pack(side="left", padx=10)
 
         # Scrollable horizontal frame for progress bars
-        scroll_frame = ctk.CTkScrollableFrame(parent, orientation="horizontal", height=100)
-        scroll_frame.pack(fill="both", expand=True, pady=5)
+        self.progress_frame = ctk.CTkScrollableFrame(parent, orientation="horizontal", height=100)
+        self.progress_frame.pack(fill="both", expand=True, pady=5)
 
-        # Create progress widget for each Life
-        for life_name, icon in LIVES:
-            self.create_life_progress_widget(scroll_frame, life_name, icon)
+    def add_progress_widgets(self, lives):
+        """Create progress widgets a few Lives per event-loop turn"""
+        for life_name, icon in lives[:STARTUP_PROGRESS_CHUNK]:
+            self.create_life_progress_widget(self.progress_frame, life_name, icon)
+
+        if len(lives) > STARTUP_PROGRESS_CHUNK:
+            self.after(1, self.add_progress_widgets, lives[STARTUP_PROGRESS_CHUNK:])
+        else:
+            self.finish_startup_stage('progress_filled')
 
     def create_life_progress_widget(self, parent, life_name, icon):
         """Create individual Life progress bar widget"""
@@ -708,35 +1215,67 @@ class ModernQuestTracker(ctk.CTk):
         header = ctk.CTkLabel(frame, text=f"{icon} {life_name}", font=("Arial", 13, "bold"))
         header.pack(pady=(8, 5))
 
+        value, text = self.progress_display(progress)
+
         # Progress bar
         progress_bar = ctk.CTkProgressBar(frame, width=200, height=20)
-        progress_bar.set(progress['percentage'] / 100)
+        progress_bar.set(value)
         progress_bar.pack(pady=5)
 
         # Progress text
         progress_label = ctk.CTkLabel(
             frame,
-            text=f"{progress['completed']}/{progress['total']} ({progress['percentage']:.0f}%)",
+            text=text,
             font=("Arial", 11)
         )
         progress_label.pack(pady=(0, 8))
 
+        # Keep references so updates can be applied in place
+        self.progress_widgets[life_name] = {
+            'bar': progress_bar,
+            'label': progress_label,
+            'value': value,
+            'text': text
+        }
+
+    def progress_display(self, progress):
+        """Bar value and label text shown for a Life's progress"""
+        value = progress['percentage'] / 100
+        text = f"{progress['completed']}/{progress['total']} ({progress['percentage']:.0f}%)"
+        return value, text
+
     def update_progress_bars(self):
-        """Refresh all progress bars"""
-        if hasattr(self, 'progress_tracker'):
-            self.progress_tracker.invalidate_cache()
-
-        # Recreate progress panel
-        if hasattr(self, 'bottom_panel'):
-            for widget in self.bottom_panel.winfo_children():
-                widget.destroy()
-            self.create_progress_panel(self.bottom_panel)
-
-    def load_quests(self):
-        """Load quests into the tree view"""
-        # Clear existing
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        """Refresh progress bars on the next idle turn of the event loop"""
+        if self.progress_tracker is None:
+            return  # Still starting up; widgets are created with current values
+
+        # Many status changes within one turn share a single refresh
+        if self.progress_update_job is None:
+            self.progress_update_job = self.after_idle(self.apply_progress_updates)
+
+    def apply_progress_updates(self):
+        """Apply changed progress values to the existing bars and labels"""
+        self.progress_update_job = None
+
+        for life_name, widgets in self.progress_widgets.items():
+            value, text = self.progress_display(self.progress_tracker.get_life_progress(life_name))
+
+            if value != widgets['value']:
+                widgets['bar'].set(value)
+                widgets['value'] = value
+
+            if text != widgets['text']:
+                widgets['label'].configure(text=text)
+                widgets['text'] = text
+
+    def load_quests(self, staged=False):
+        """Load quests into the tree view
+
+        With staged=True (first fill at startup) the top of the list is shown
+        right away and the rest is added a chunk per event-loop turn.
+        """
+        if not self.data_ready:
+            return  # Loaded by load_data once startup has the quests
 
         # Build filters
         filters = {}
@@ -754,6 +1293,12 @@ class ModernQuestTracker(ctk.CTk):
         if self.current_life_filter:
             filters['life'] = self.current_life_filter
 
+        # Location browser filter
+        if self.current_location_filter:
+            filters['place'] = self.current_location_filter
+        elif self.current_region_filter:
+            filters['region'] = self.current_region_filter
+
         sort_by = self.sort_var.get()
         filters['sort_by'] = sort_by
 
@@ -762,28 +1307,33 @@ class ModernQuestTracker(ctk.CTk):
         # Load quests
         quests = self.db.get_all_quests(filters)
 
-        status_names = ["Unobtained", "Obtained", "Completed", "Turned In"]
-        status_colors = ["#ff6b6b", "#ffd43b", "#51cf66", "#339af0"]
-
-        for quest in quests:
-            status_text = status_names[quest['status']]
-            values = (
-                status_text,
-                quest['name'] or "",
-                quest['life'] or "",
-                quest['rank'] or "",   # Rank
-                quest['giver'] or "",  # NPC/Giver
-                quest['turn_in'] or ""
-            )
+        # A newer load replaces a staged fill that is still running
+        if self.populate_job is not None:
+            self.after_cancel(self.populate_job)
+            self.populate_job = None
+            staged = False
 
-            item_id = self.tree.insert("", "end", values=values, tags=(str(quest['row_id']), f"status_{quest['status']}"))
-
-            # Color code rows
-            self.tree.tag_configure(f"status_{quest['status']}", background=status_colors[quest['status']], foreground="black")
+        if staged:
+            self.populate_tree(quests, 0)
+        else:
+            # Move, hide, insert or update only the rows that changed
+            self.tree_view.render(quests)
+            self.finish_startup_stage('tree_filled')
 
         # Update statistics
         self.update_statistics()
 
+    def populate_tree(self, quests, shown):
+        """Show one more chunk of quests; the rows already shown stay as they are"""
+        self.populate_job = None
+        shown += STARTUP_TREE_CHUNK
+        self.tree_view.render(quests[:shown])
+
+        if shown < len(quests):
+            self.populate_job = self.after(1, self.populate_tree, quests, shown)
+        else:
+            self.finish_startup_stage('tree_filled')
+
     def update_statistics(self):
         """Update statistics display"""
         stats = self.db.get_statistics()
@@ -824,11 +1374,15 @@ class ModernQuestTracker(ctk.CTk):
             quest_id = int(item['tags'][0])
             self.show_quest_details(quest_id)
 
+    def open_url(self, url):
+        """Open a quest's wiki page in the browser"""
+        import webbrowser  # Loaded on first use, not at startup
+        webbrowser.open(url)
+
     def show_quest_details(self, quest_id):
         """Show quest details in right panel"""
-        cursor = self.db.conn.cursor()
-        cursor.execute('SELECT * FROM quests WHERE row_id = ?', (quest_id,))
-        quest = cursor.fetchone()
+        # Served from the quest index, which already holds queued edits
+        quest = self.db.get_quest_index().get(quest_id)
 
         if not quest:
             return
@@ -843,6 +1397,7 @@ class ModernQuestTracker(ctk.CTk):
 
         self.details_text.delete("1.0", "end")
         self.details_text.insert("1.0", details)
+        self.show_place_image(quest['turn_in'])
 
         # Add/update wiki button if URL exists
         if quest['url']:
@@ -852,7 +1407,7 @@ class ModernQuestTracker(ctk.CTk):
             self.wiki_button = ctk.CTkButton(
                 self.details_text.master,
                 text="🌐 Open Wiki",
-                command=lambda: webbrowser.open(quest['url']),
+                command=lambda: self.open_url(quest['url']),
                 fg_color="#4a9eff",
                 hover_color="#357abd",
                 height=35,
@@ -890,6 +1445,7 @@ class ModernQuestTracker(ctk.CTk):
         quest_id = list(self.selected_quests)[0]
         note = self.notes_text.get("1.0", "end-1c")
         self.db.add_note(quest_id, note)
+        self.schedule_flush()
         # Note saved silently - no popup
 
     def update_selected_status(self, new_status):
@@ -897,11 +1453,54 @@ class ModernQuestTracker(ctk.CTk):
         if not self.selected_quests:
             return  # Silently return if nothing selected
 
-        self.db.bulk_update_status(list(self.selected_quests), new_status)
-        self.load_quests()
-        self.update_progress_bars()  # Refresh progress bars
+        changes, histogram = self.db.bulk_update_status(list(self.selected_quests), new_status)
+        if not changes:
+            return
+        self.schedule_flush()
+
+        if histogram['before'] != histogram['after']:
+            self.progress_tracker.apply_status_changes(changes)
+            self.update_progress_bars()  # Refresh progress bars
+
+            # Relabel only the locations and regions of quests that changed
+            changed_ids = [quest['row_id'] for quest, old_status in changes if old_status != new_status]
+            self.update_location_counts(*self.db.get_quest_index().places_of(changed_ids))
+
+        if self.current_filters.get('status') is None and \
+                self.current_filters.get('sort_by') not in ('status', 'last_modified'):
+            # Membership and order are unaffected: refresh just these rows
+            self.tree_view.update_rows(quest for quest, _ in changes)
+            self.update_statistics()
+        else:
+            self.load_quests()
         # Status updated silently - no popup
 
+    def schedule_flush(self):
+        """Group queued database edits into one commit
+
+        Every edit restarts the idle timer; the deadline timer is only set by
+        the first edit of a batch so a steady stream of edits still commits.
+        """
+        if self.flush_idle_job is not None:
+            self.after_cancel(self.flush_idle_job)
+        self.flush_idle_job = self.after(FLUSH_IDLE_MS, self.flush_writes)
+
+        if self.flush_deadline_job is None:
+            self.flush_deadline_job = self.after(FLUSH_MAX_DELAY_MS, self.flush_writes)
+
+    def cancel_flush(self):
+        """Stop the flush timers"""
+        for job in (self.flush_idle_job, self.flush_deadline_job):
+            if job is not None:
+                self.after_cancel(job)
+        self.flush_idle_job = None
+        self.flush_deadline_job = None
+
+    def flush_writes(self):
+        """Commit queued database edits"""
+        self.cancel_flush()
+        self.db.flush()
+
     def show_bulk_operations(self):
         """Show bulk operations dialog"""
         if not self.selected_quests:
@@ -953,9 +1552,18 @@ class ModernQuestTracker(ctk.CTk):
 
     def export_data(self):
         """Export quest data to JSON"""
+        if not self.data_ready:
+            return  # The first-run import may still be writing the quests
+
         filename = filedialog.asksaveasfilename(
             defaultextension=".json",
-            filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
+            filetypes=[
+                ("JSON files", "*.json"),
+                ("NDJSON files", "*.ndjson"),
+                ("Compressed JSON", "*.json.gz"),
+                ("Compressed NDJSON", "*.ndjson.gz"),
+                ("All files", "*.*")
+            ]
         )
 
         if filename:
@@ -971,19 +1579,48 @@ class ModernQuestTracker(ctk.CTk):
 
     def import_data(self):
         """Import quest data from JSON"""
+        if not self.data_ready:
+            return  # Wait until startup has loaded the quests
+
         filename = filedialog.askopenfilename(
             defaultextension=".json",
-            filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
+            filetypes=[
+                ("JSON files", "*.json *.ndjson *.jsonl"),
+                ("Compressed JSON", "*.json.gz *.ndjson.gz *.jsonl.gz"),
+                ("All files", "*.*")
+            ]
         )
 
-        if filename:
-            try:
-                with open(filename, 'r') as f:
-                    data = json.load(f)
-                # TODO: Implement import logic
-                messagebox.showinfo("Import", "Import functionality coming soon!")
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to import data: {str(e)}")
+        if not filename:
+            return
+
+        merge = messagebox.askyesnocancel(
+            "Import",
+            "Merge with your current progress?\n\n"
+            "Yes: keep whichever change is newer for each quest\n"
+            "No: replace your progress with the file's for every quest it lists"
+        )
+        if merge is None:
+            return
+
+        try:
+            self.flush_writes()
+            summary = self.db.import_from_json(filename, 'merge' if merge else 'replace')
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to import data: {str(e)}")
+            return
+
+        # One refresh for the whole import
+        self.progress_tracker.invalidate_cache()
+        self.load_quests()
+        self.update_progress_bars()
+        self.update_location_counts()
+
+        message = (f"Read {summary['read']} quests: updated {summary['statuses']} statuses, "
+                   f"{summary['notes']} notes and the tags of {summary['tags']} quests.")
+        if summary['skipped']:
+            message += f"\n\nSkipped {summary['skipped']} malformed or unknown quests."
+        messagebox.showinfo("Import Complete", message)
 
     def toggle_left_panel(self):
         """Toggle visibility of left sidebar"""
@@ -1025,7 +1662,9 @@ class ModernQuestTracker(ctk.CTk):
 
     def on_closing(self):
         """Handle window close"""
-        self.db.close()
+        self.cancel_flush()
+        self.image_manager.shutdown()
+        self.db.close()  # Commits queued edits
         self.destroy()
 
 
@@ -0,0 +1,65 @@
+"""
+Benchmark: export_to_json
+
+Compares the previous exporter (two queries per quest, whole list held in
+memory) with the streaming exporter, by time and peak Python memory.
+
+Usage: python benchmarks/bench_export.py
+"""
+
+import json
+import os
+import tempfile
+import tracemalloc
+
+from common import build_quest_db, time_call
+
+
+def legacy_export(db, filename):
+    """The exporter as it was before streaming (for comparison only)"""
+    cursor = db.conn.cursor()
+    # The columns SELECT * returned before rank_ord was added
+    cursor.execute('SELECT row_id, status, name, life, rank, giver, description, turn_in, url, '
+                   'last_modified FROM quests')
+    quests = [dict(row) for row in cursor.fetchall()]
+
+    for quest in quests:
+        quest['note'] = db.get_note(quest['row_id'])
+        quest['tags'] = db.get_tags(quest['row_id'])
+
+    with open(filename, 'w') as f:
+        json.dump(quests, f, indent=2, default=str)
+
+
+def peak_memory(func):
+    """Peak traced allocation of func() in KiB"""
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 1024
+
+
+def main():
+    db = build_quest_db()
+    out_dir = tempfile.mkdtemp(prefix="quest_export_")
+    legacy_file = os.path.join(out_dir, "legacy.json")
+
+    cases = [
+        ("legacy (N+1 queries)", lambda: legacy_export(db, legacy_file)),
+        ("streaming JSON", lambda: db.export_to_json(os.path.join(out_dir, "quests.json"))),
+        ("streaming NDJSON", lambda: db.export_to_json(os.path.join(out_dir, "quests.ndjson"))),
+        ("streaming NDJSON + gzip", lambda: db.export_to_json(os.path.join(out_dir, "quests.ndjson.gz"))),
+    ]
+
+    for label, func in cases:
+        print(f"{label:26s} {time_call(func):8.1f} ms   peak {peak_memory(func):8.0f} KiB")
+
+    with open(legacy_file) as a, open(os.path.join(out_dir, "quests.json")) as b:
+        print("JSON output identical:", a.read() == b.read())
+
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
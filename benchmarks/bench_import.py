@@ -0,0 +1,96 @@
+"""
+Benchmark: first-run import of FLData.xlsx + currentprogress.txt
+
+Compares the previous cell-by-cell importer with the streaming
+workbook importer and the import from a compiled quest snapshot.
+
+Usage: python benchmarks/bench_import.py
+"""
+
+import os
+import tempfile
+
+from common import time_call
+
+from openpyxl import load_workbook
+from FantasyLifeQuestTracker_Modern import QuestDatabase
+from modules.quest_snapshot import build_snapshot
+
+
+def legacy_import(db, progress_file, excel_file):
+    """The importer as it was before streaming (for comparison only)"""
+    with open(progress_file, 'r') as f:
+        data = f.read().splitlines()
+
+    wb = load_workbook(excel_file)
+    sheet = wb['Sheet1']
+    cursor = db.conn.cursor()
+
+    for row_idx in range(2, len(data)):
+        status = int(data[row_idx])
+        name = sheet.cell(row=row_idx, column=7).value
+        life = sheet.cell(row=row_idx, column=5).value
+        giver = sheet.cell(row=row_idx, column=4).value
+        rank = sheet.cell(row=row_idx, column=6).value
+        description = sheet.cell(row=row_idx, column=8).value
+        turn_in = sheet.cell(row=row_idx, column=9).value
+        url = sheet.cell(row=row_idx, column=3).value
+
+        cursor.execute('''
+            INSERT OR REPLACE INTO quests
+            (row_id, status, name, life, rank, giver, description, turn_in, url)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', (row_idx, status, name, life, rank, giver, description, turn_in, url))
+
+        for col in range(10, 51):
+            if sheet.cell(row=row_idx, column=col).value == 1:
+                location = sheet.cell(row=1, column=col).value
+                cursor.execute('''
+                    INSERT INTO quest_locations (quest_id, location)
+                    VALUES (?, ?)
+                ''', (row_idx, location))
+
+    db.conn.commit()
+    wb.close()
+
+
+def fresh_db():
+    return QuestDatabase(os.path.join(tempfile.mkdtemp(prefix="quest_bench_"), "quest_tracker.db"))
+
+
+def table_snapshot(db):
+    cursor = db.conn.cursor()
+    cursor.execute('SELECT row_id, status, name, life, rank, giver, description, turn_in, url FROM quests ORDER BY row_id')
+    quests = [tuple(row) for row in cursor.fetchall()]
+    cursor.execute('SELECT quest_id, location FROM quest_locations ORDER BY quest_id, location')
+    locations = [tuple(row) for row in cursor.fetchall()]
+    return quests, locations
+
+
+def main():
+    args = ("currentprogress.txt", "FLData.xlsx")
+    snapshot_file = os.path.join(tempfile.mkdtemp(prefix="quest_bench_"), "FLData.snapshot.db")
+
+    old_ms = time_call(lambda: legacy_import(fresh_db(), *args), repeat=3)
+    stream_ms = time_call(lambda: fresh_db().import_from_workbook(*args), repeat=3)
+    build_ms = time_call(lambda: build_snapshot(snapshot_file), repeat=3)
+    snapshot_ms = time_call(lambda: fresh_db().import_from_snapshot(args[0], snapshot_file), repeat=3)
+
+    reference = fresh_db()
+    legacy_import(reference, *args)
+    expected = table_snapshot(reference)
+
+    streamed = fresh_db()
+    streamed.import_from_workbook(*args)
+    from_snapshot = fresh_db()
+    from_snapshot.import_from_snapshot(args[0], snapshot_file)
+
+    print(f"{'importer':<22}{'time (ms)':>12}{'identical':>12}")
+    print(f"{'cell-by-cell':<22}{old_ms:>12.1f}{'-':>12}")
+    print(f"{'streaming workbook':<22}{stream_ms:>12.1f}{str(table_snapshot(streamed) == expected):>12}")
+    print(f"{'snapshot':<22}{snapshot_ms:>12.1f}{str(table_snapshot(from_snapshot) == expected):>12}")
+    print(f"{'(snapshot build)':<22}{build_ms:>12.1f}{'-':>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Benchmark: place button counters in the legacy tracker
+
+Compares the former initializeCount walk (a findLocation per quest and
+location) with loading the bit-packed LocationCounts matrix from the
+snapshot, then replays random status changes through both and checks the
+counters still agree. Exits with status 1 if the matrix build is slower
+than the walk or any count differs.
+
+Usage: python benchmarks/bench_legacy_counts.py
+"""
+
+import random
+import sys
+from common import load_legacy_tracker, time_call
+from modules.location_counts import LocationCounts
+
+CHANGES = 2000
+
+
+def walk_counts(legacy):
+    """The former initializeCount loop (for comparison only)"""
+    counts = [[0, 0, 0, 0] for _ in range(48)]
+    find_location = legacy['findLocation']
+    for quest in legacy['quest_cache']:
+        status = quest['status']
+        counts[legacy['allIndex']][status] += 1
+        if quest['life'] is not None:
+            counts[legacy['livesIndex']][status] += 1
+        if status != 1:
+            index = find_location(quest['turn_in'])
+            if index >= 0:
+                counts[index][status] += 1
+        else:
+            for name in quest['locations']:
+                index = find_location(name)
+                if index >= 0:
+                    counts[index][status] += 1
+    return counts
+
+
+def build_matrix(legacy):
+    counts = LocationCounts(48, legacy['allIndex'], legacy['livesIndex'])
+    counts.build(legacy['quest_cache'], *legacy['snapshot'].place_matrix())
+    return counts
+
+
+def main():
+    legacy = load_legacy_tracker()
+    quest_cache = legacy['quest_cache']
+
+    old = time_call(lambda: walk_counts(legacy), 20)
+    new = time_call(lambda: build_matrix(legacy), 20)
+    matrix = build_matrix(legacy)
+    same = walk_counts(legacy) == [list(c) for c in matrix.counts]
+    print(f"initialize  walk {old:6.2f} ms   matrix build {new:6.2f} ms   same counts: {same}")
+    ok = same and new <= old
+
+    # Random status changes applied as matrix-row deltas
+    rng = random.Random(1)
+    changes = [(rng.choice(quest_cache), rng.randrange(4)) for _ in range(CHANGES)]
+    redrawn = 0
+
+    def apply_changes():
+        nonlocal redrawn
+        for quest, status in changes:
+            redrawn += len(matrix.change(quest['row'], quest['status'], status))
+            quest['status'] = status
+
+    elapsed = time_call(apply_changes, 1)
+    same = walk_counts(legacy) == [list(c) for c in matrix.counts]
+    same_histograms = all(matrix.histogram(p) == list(matrix.counts[p]) for p in range(48))
+    print(f"{CHANGES} changes {elapsed:6.2f} ms ({elapsed / CHANGES * 1000:.1f} us each), "
+          f"{redrawn / CHANGES:.1f} labels redrawn per change   "
+          f"same counts: {same}   deltas match popcounts: {same_histograms}")
+    ok = ok and same and same_histograms
+
+    legacy['snapshot'].close()
+    if not ok:
+        print("FAIL: matrix build slower than the walk or counts differ")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
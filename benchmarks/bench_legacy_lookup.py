@@ -0,0 +1,76 @@
+"""
+Benchmark: quest and place lookups in the legacy tracker
+
+Compares the former linear scans of quest_cache/placedata with the row
+and place-name indexes built by build_quest_cache, for the lookups one
+page render (29 rows) and one status change perform.
+
+Usage: python benchmarks/bench_legacy_lookup.py
+"""
+
+from common import load_legacy_tracker, time_call
+
+PAGE_SIZE = 29
+
+
+def scan_quest(quest_cache, row_idx):
+    """The former lookup (for comparison only)"""
+    for quest in quest_cache:
+        if quest['row'] == row_idx:
+            return quest
+    return None
+
+
+def scan_location(place_names, name):
+    """The former findLocation (for comparison only)"""
+    for i in range(len(place_names)):
+        if place_names[i] == name:
+            return i
+    return -1
+
+
+def main():
+    legacy = load_legacy_tracker()
+    quest_cache = legacy['quest_cache']
+    place_names = [name for name, _ in legacy['snapshot'].places()]
+    find_quest = legacy['findQuest']
+    find_location = legacy['findLocation']
+
+    # Worst case: the last page of the unfiltered list
+    page = [quest['row'] for quest in quest_cache[-PAGE_SIZE:]]
+
+    def page_scan():
+        for row_idx in page:
+            scan_quest(quest_cache, row_idx)
+
+    def page_index():
+        for row_idx in page:
+            find_quest(row_idx)
+
+    def click_scan():
+        for row_idx in page:
+            quest = scan_quest(quest_cache, row_idx)
+            scan_location(place_names, quest['turn_in'])
+            for name in quest['locations']:
+                scan_location(place_names, name)
+
+    def click_index():
+        for row_idx in page:
+            quest = find_quest(row_idx)
+            find_location(quest['turn_in'])
+            for name in quest['locations']:
+                find_location(name)
+
+    print(f"page render lookups, linear scan: {time_call(page_scan, 20):8.3f} ms")
+    print(f"page render lookups, row index:   {time_call(page_index, 20):8.3f} ms")
+    print(f"{PAGE_SIZE} status changes, linear scan: {time_call(click_scan, 20):8.3f} ms")
+    print(f"{PAGE_SIZE} status changes, indexes:     {time_call(click_index, 20):8.3f} ms")
+
+    assert all(find_quest(row) is scan_quest(quest_cache, row) for row in page)
+    assert all(find_location(name) == scan_location(place_names, name) for name in place_names)
+
+    legacy['snapshot'].close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Benchmark: cold-start import cost of both entry points
+
+Runs each entry point's import phase in a fresh interpreter under
+-X importtime and reports the total and the slowest imports. Exits with
+status 1 if a heavy dependency is loaded at startup or an entry point
+goes over its time budget, so it can guard against regressions.
+
+Usage: python benchmarks/bench_startup.py [--runs N] [--budget-scale X]
+"""
+
+import argparse
+import subprocess
+import sys
+
+from common import ROOT
+
+# Entry point -> (code run in a fresh interpreter, budget in ms,
+#                 modules that must not be imported at startup)
+# customtkinter itself imports PIL, so only the legacy tracker is held to
+# a PIL-free startup.
+ENTRY_POINTS = {
+    'FantasyLifeQuestTracker_Modern.py': (
+        "import FantasyLifeQuestTracker_Modern",
+        400,
+        ('pandas', 'openpyxl', 'webbrowser')
+    ),
+    'FantasyLifeQuestTracker.py': (
+        # Everything before the script's main section (which opens the window)
+        "exec(compile(open('FantasyLifeQuestTracker.py', encoding='utf-8').read()"
+        ".split('###############MAIN')[0], 'FantasyLifeQuestTracker.py', 'exec'))",
+        150,
+        ('pandas', 'openpyxl', 'PIL', 'webbrowser')
+    )
+}
+
+
+def profile_imports(code):
+    """Run code under -X importtime; returns [(module, self_us, cumulative_us, depth)]"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+
+    imports = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        imports.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return imports
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="runs per entry point (best is kept)")
+    parser.add_argument("--budget-scale", type=float, default=1.0,
+                        help="multiply every budget (for slower machines)")
+    args = parser.parse_args()
+
+    failed = False
+    for entry_point, (code, budget_ms, forbidden) in ENTRY_POINTS.items():
+        runs = [profile_imports(code) for _ in range(args.runs)]
+        best = min(runs, key=lambda imports: sum(i[1] for i in imports))
+        total_ms = sum(i[1] for i in best) / 1000
+        budget_ms *= args.budget_scale
+
+        print(f"{entry_point}: {total_ms:.1f} ms in {len(best)} imports (budget {budget_ms:.0f} ms)")
+        top_level = sorted((i for i in best if i[3] <= 1), key=lambda i: -i[2])
+        for name, _, cumulative_us, _ in top_level[:8]:
+            print(f"    {cumulative_us / 1000:8.1f} ms  {name}")
+
+        loaded = sorted({i[0].split('.')[0] for i in best} & set(forbidden))
+        if loaded:
+            print(f"    FAIL: imported at startup: {', '.join(loaded)}")
+            failed = True
+        if total_ms > budget_ms:
+            print("    FAIL: over budget")
+            failed = True
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
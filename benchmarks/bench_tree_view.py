@@ -0,0 +1,93 @@
+"""
+Benchmark: quest tree refresh on filter and sort changes
+
+Compares the old clear-and-reinsert refresh with the reconciling
+QuestTreeView over the full 1296-quest set.
+
+Usage: python benchmarks/bench_tree_view.py
+"""
+
+import tkinter as tk
+from tkinter import ttk
+
+from common import build_quest_db, time_call
+
+from modules.tree_view import QuestTreeView, diff_rows, quest_row
+
+COLUMNS = ("Status", "Name", "Life", "Rank", "Giver", "Turn In")
+
+# (label, filters before, filters after)
+SCENARIOS = [
+    ("sort name -> rank", {'sort_by': 'name'}, {'sort_by': 'rank'}),
+    ("sort rank -> life", {'sort_by': 'rank'}, {'sort_by': 'life'}),
+    ("filter all -> Unobtained", {'sort_by': 'name'}, {'sort_by': 'name', 'status': 0}),
+    ("filter Unobtained -> all", {'sort_by': 'name', 'status': 0}, {'sort_by': 'name'}),
+    ("filter all -> Paladin", {'sort_by': 'name'}, {'sort_by': 'name', 'life': 'Paladin'}),
+    ("search 'a' -> 'an'", {'sort_by': 'name', 'search': 'a'}, {'sort_by': 'name', 'search': 'an'}),
+]
+
+
+def full_reload(tree, quests):
+    """The previous load_quests behaviour"""
+    for item in tree.get_children():
+        tree.delete(item)
+    for quest in quests:
+        values, tags = quest_row(quest)
+        tree.insert("", "end", values=values, tags=tags)
+        tree.tag_configure(tags[1], background="#ffffff", foreground="black")
+
+
+def plan_only(before, after):
+    """Diff computation alone, for environments without a display"""
+    old_rows = {str(q['row_id']): quest_row(q) for q in before}
+    old_order = [str(q['row_id']) for q in before]
+    new_rows = {str(q['row_id']): quest_row(q) for q in after}
+    new_order = [str(q['row_id']) for q in after]
+    diff_rows(old_rows, old_order, new_rows, new_order)
+
+
+def main():
+    db = build_quest_db()
+    results = [(label, db.get_all_quests(before), db.get_all_quests(after))
+               for label, before, after in SCENARIOS]
+
+    try:
+        root = tk.Tk()
+        root.withdraw()
+    except tk.TclError:
+        print("No display available - timing the diff computation only\n")
+        print(f"{'scenario':<28}{'rows':>6}{'diff (ms)':>12}")
+        for label, before, after in results:
+            ms = time_call(lambda: plan_only(before, after))
+            print(f"{label:<28}{len(after):>6}{ms:>12.2f}")
+        db.close()
+        return
+
+    print(f"{'scenario':<28}{'rows':>6}{'reload (ms)':>14}{'reconcile (ms)':>16}")
+    for label, before, after in results:
+        old_tree = ttk.Treeview(root, columns=COLUMNS, show="headings")
+        new_tree = ttk.Treeview(root, columns=COLUMNS, show="headings")
+        view = QuestTreeView(new_tree)
+
+        def run_reload():
+            full_reload(old_tree, before)
+            full_reload(old_tree, after)
+
+        def run_reconcile():
+            view.render(before)
+            view.render(after)
+
+        # Each run shows the first result set, then switches to the second
+        reload_ms = time_call(run_reload)
+        reconcile_ms = time_call(run_reconcile)
+        print(f"{label:<28}{len(after):>6}{reload_ms:>14.2f}{reconcile_ms:>16.2f}")
+
+        old_tree.destroy()
+        new_tree.destroy()
+
+    root.destroy()
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
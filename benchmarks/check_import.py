@@ -0,0 +1,87 @@
+"""
+Regression check: statuses imported without a last_modified
+
+Imports quest records that carry a status but no last_modified, in merge
+and replace mode, and checks that no quest is left with a NULL timestamp
+and that the quest index agrees with SQLite. Exits with status 1 on any
+failure.
+
+Usage: python benchmarks/check_import.py
+"""
+
+import json
+import os
+import sys
+import tempfile
+
+from common import build_quest_db
+
+
+def import_records(db, records, mode):
+    fd, filename = tempfile.mkstemp(suffix=".ndjson")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record) + "\n")
+    try:
+        return db.import_from_json(filename, mode)
+    finally:
+        os.remove(filename)
+
+
+def stored(db, row_id):
+    row = db.conn.execute("SELECT status, last_modified FROM quests WHERE row_id = ?", (row_id,)).fetchone()
+    return row["status"], row["last_modified"]
+
+
+def indexed(db, row_id):
+    record = db.get_quest_index().get(row_id)
+    return record["status"], record["last_modified"]
+
+
+def main():
+    db = build_quest_db()
+    failed = 0
+
+    def check(name, ok, detail=""):
+        nonlocal failed
+        print(f"{'ok' if ok else 'FAIL':4s}  {name}" + (f": {detail}" if detail and not ok else ""))
+        failed += not ok
+
+    row_id = 2
+    db.bulk_update_status([row_id], 1)
+    db.flush()
+    before = stored(db, row_id)
+
+    # Merge: without a timestamp the file cannot win, ours is kept
+    summary = import_records(db, [{"row_id": row_id, "status": 3}], "merge")
+    check("merge keeps status and timestamp", stored(db, row_id) == before, f"{stored(db, row_id)} != {before}")
+    check("merge changes nothing", summary["statuses"] == 0, summary)
+
+    # Replace: the status is taken and stamped with the import time
+    summary = import_records(db, [{"row_id": row_id, "status": 3}], "replace")
+    status, last_modified = stored(db, row_id)
+    check("replace takes the status", status == 3 and summary["statuses"] == 1, (status, summary))
+    check("replace sets last_modified", last_modified is not None and last_modified >= before[1],
+          f"{last_modified!r} before {before[1]!r}")
+    check("index matches SQLite", indexed(db, row_id) == stored(db, row_id),
+          f"{indexed(db, row_id)} != {stored(db, row_id)}")
+
+    # Replace with the same status leaves the timestamp alone
+    before = stored(db, row_id)
+    summary = import_records(db, [{"row_id": row_id, "status": 3}], "replace")
+    check("unchanged replace is a no-op", stored(db, row_id) == before and summary["statuses"] == 0, summary)
+
+    nulls = db.conn.execute("SELECT COUNT(*) FROM quests WHERE last_modified IS NULL").fetchone()[0]
+    check("no NULL last_modified", nulls == 0, f"{nulls} quests")
+
+    # A fresh index loaded from SQLite agrees with the written-through one
+    written = indexed(db, row_id)
+    db.quest_index = None
+    check("reloaded index matches", indexed(db, row_id) == written, f"{indexed(db, row_id)} != {written}")
+
+    db.close()
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
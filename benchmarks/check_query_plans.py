@@ -0,0 +1,78 @@
+"""
+Regression check: query plans of the SQL the tracker still runs
+
+Builds a quest database and runs EXPLAIN QUERY PLAN on each hot query.
+A query fails if it scans a table without an index (unless that scan is
+the point of the query, like exporting every quest), sorts or groups
+through a temp b-tree, or needs an automatic index. Exits with status 1
+on any failure.
+
+Usage: python benchmarks/check_query_plans.py [-v]
+"""
+
+import sys
+
+from common import build_quest_db
+from modules.progress_tracker import COUNTS_QUERY
+from modules.quest_io import EXPORT_QUERY
+
+# (name, query, tables it may scan in full)
+HOT_QUERIES = [
+    ("progress counts", COUNTS_QUERY, ()),
+    ("rank order", "SELECT row_id FROM quests ORDER BY rank_ord, name, row_id", ()),
+    ("export", EXPORT_QUERY, ('q',)),  # Every quest is exported
+    ("note lookup", "SELECT note FROM quest_notes WHERE quest_id = ?", ()),
+    ("tag lookup", "SELECT tag FROM quest_tags WHERE quest_id = ?", ()),
+    ("tag insert", "INSERT OR IGNORE INTO quest_tags (quest_id, tag) VALUES (?, ?)", ()),
+    ("quests at location", "SELECT quest_id FROM quest_locations WHERE location = ?", ()),
+    ("quests with tag", "SELECT quest_id FROM quest_tags WHERE tag = ?", ()),
+    ("status update", "UPDATE quests SET status = ?, last_modified = ? WHERE row_id IN (?, ?, ?)", ()),
+    ("re-import locations",
+     "DELETE FROM quest_locations WHERE quest_id IN (SELECT row_id FROM temp.import_quests)",
+     ('import_quests',)),  # Every staged quest is replaced
+]
+
+
+def plan_problems(detail, allowed_scans):
+    """Reasons a query plan step is not acceptable"""
+    problems = []
+    if detail.startswith("SCAN ") and " USING " not in detail:
+        table = detail.split()[1]
+        if table not in allowed_scans:
+            problems.append(f"full scan of {table}")
+    if "TEMP B-TREE" in detail:
+        problems.append("temp b-tree")
+    if "AUTOMATIC" in detail:
+        problems.append("automatic index")
+    return problems
+
+
+def main():
+    verbose = "-v" in sys.argv[1:]
+    db = build_quest_db()
+    db.add_tag(2, "later")
+    db.add_note(2, "check the ruins")
+    db.flush()
+
+    cursor = db.conn.cursor()
+    cursor.execute("CREATE TEMP TABLE IF NOT EXISTS import_quests (row_id INTEGER PRIMARY KEY)")
+
+    failed = 0
+    for name, query, allowed_scans in HOT_QUERIES:
+        cursor.execute("EXPLAIN QUERY PLAN " + query, [1] * query.count("?"))
+        steps = [row[3] for row in cursor.fetchall()]
+        problems = [problem for step in steps for problem in plan_problems(step, allowed_scans)]
+
+        print(f"{'FAIL' if problems else 'ok':4s}  {name}" + (f": {', '.join(problems)}" if problems else ""))
+        if problems or verbose:
+            for step in steps:
+                print(f"        {step}")
+        failed += bool(problems)
+
+    db.close()
+    print(f"{len(HOT_QUERIES) - failed}/{len(HOT_QUERIES)} query plans ok")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Shared helpers for the benchmark scripts
+Builds a throwaway quest database from the bundled legacy files
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Benchmarks are run as scripts from anywhere; resolve data files and the
+# application modules relative to the repository root
+os.chdir(ROOT)
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+
+def build_quest_db():
+    """Create a temporary QuestDatabase holding all 1296 quests"""
+    from FantasyLifeQuestTracker_Modern import QuestDatabase
+
+    db_dir = tempfile.mkdtemp(prefix="quest_bench_")
+    db = QuestDatabase(os.path.join(db_dir, "quest_tracker.db"))
+    db.import_from_legacy("currentprogress.txt", "FLData.xlsx")
+    return db
+
+
+def time_call(func, repeat=5):
+    """Return the best wall-clock time of func() in milliseconds"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = (time.perf_counter() - start) * 1000
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+def load_legacy_tracker():
+    """Load FantasyLifeQuestTracker.py's functions and quest cache without its UI
+
+    Executes the script up to its main section and then performs the same
+    data loading steps as startup. Returns the module namespace.
+    """
+    from modules.quest_snapshot import QuestSnapshot, ensure_snapshot
+
+    with open(os.path.join(ROOT, "FantasyLifeQuestTracker.py"), encoding="utf-8") as f:
+        source = f.read().split("###############MAIN")[0]
+
+    legacy = {'__name__': 'legacy_tracker'}
+    exec(compile(source, "FantasyLifeQuestTracker.py", "exec"), legacy)
+    legacy['read']()
+    legacy['snapshot'] = QuestSnapshot(ensure_snapshot())
+    legacy['build_quest_cache']()
+    return legacy
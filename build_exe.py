@@ -4,10 +4,17 @@ Run this script to create a standalone .exe file
 """
 import PyInstaller.__main__
 import os
+from modules.quest_snapshot import ensure_snapshot
 
 # Get the directory of this script
 base_dir = os.path.dirname(os.path.abspath(__file__))
 
+# Compile quest data so the executable never parses Excel at startup
+ensure_snapshot(os.path.join(base_dir, "FLData.snapshot.db"),
+                os.path.join(base_dir, "FLData.xlsx"),
+                os.path.join(base_dir, "placenames.txt"),
+                os.path.join(base_dir, "imagenames.txt"))
+
 PyInstaller.__main__.run([
     'FantasyLifeQuestTracker_Modern.py',
     '--name=FantasyLifeQuestTracker',
@@ -17,6 +24,7 @@ PyInstaller.__main__.run([
     f'--add-data={os.path.join(base_dir, "modules")}{os.pathsep}modules',
     f'--add-data={os.path.join(base_dir, "Images")}{os.pathsep}Images',
     f'--add-data={os.path.join(base_dir, "FLData.xlsx")}{os.pathsep}.',
+    f'--add-data={os.path.join(base_dir, "FLData.snapshot.db")}{os.pathsep}.',
     f'--add-data={os.path.join(base_dir, "currentprogress.txt")}{os.pathsep}.',
     f'--add-data={os.path.join(base_dir, "placenames.txt")}{os.pathsep}.',
     f'--add-data={os.path.join(base_dir, "imagenames.txt")}{os.pathsep}.',
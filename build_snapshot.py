@@ -0,0 +1,13 @@
+"""
+Build script for the compiled quest data snapshot
+Run this script after editing FLData.xlsx, placenames.txt or imagenames.txt
+(the trackers also rebuild a stale snapshot on startup)
+"""
+from modules.quest_snapshot import DEFAULT_SNAPSHOT, build_snapshot, source_hash
+
+build_snapshot(DEFAULT_SNAPSHOT)
+
+print("\n" + "="*70)
+print(f"Snapshot built: {DEFAULT_SNAPSHOT}")
+print(f"Source hash: {source_hash('FLData.xlsx', 'placenames.txt', 'imagenames.txt')}")
+print("="*70)
@@ -3,8 +3,32 @@ Fantasy Life Quest Tracker - Module Package
 Contains helper modules for the modernized quest tracker
 """
 
-from .constants import *
-from .region_mapping import *
+import importlib
+
+# Re-exported name -> submodule defining it. Submodules are imported on
+# first access (PEP 562), so importing one helper module does not load
+# the others.
+_EXPORTS = {
+    'LIVES': 'constants',
+    'RANK_ORDER': 'constants',
+    'STATUS_COLORS': 'constants',
+    'STATUS_NAMES': 'constants',
+    'REGION_LOCATION_MAP': 'region_mapping',
+    'REGIONAL_MAPS': 'region_mapping'
+}
 
 __all__ = ['LIVES', 'RANK_ORDER', 'STATUS_COLORS', 'STATUS_NAMES',
            'REGION_LOCATION_MAP', 'REGIONAL_MAPS']
+
+
+def __getattr__(name):
+    submodule = _EXPORTS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{submodule}", __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -32,6 +32,15 @@ RANK_ORDER = [
     "Creator"
 ]
 
+# Persisted as quests.rank_ord so rank order is an indexed integer sort
+RANK_ORDINALS = {rank: position for position, rank in enumerate(RANK_ORDER, start=1)}
+UNKNOWN_RANK_ORD = 99  # Quests without a known rank sort last
+
+
+def rank_ordinal(rank):
+    """Ordinal of a rank for sorting (1 = Novice)"""
+    return RANK_ORDINALS.get(rank, UNKNOWN_RANK_ORD)
+
 # Status colors for quest rows
 STATUS_COLORS = {
     0: "#ff6b6b",  # Unobtained - Red
@@ -0,0 +1,95 @@
+"""
+Image Cache for Fantasy Life Quest Tracker
+Byte-budgeted LRU for loaded images
+"""
+
+from collections import OrderedDict
+
+
+def image_nbytes(pil_image):
+    """Size of a PIL image's pixel buffer in bytes"""
+    width, height = pil_image.size
+    return width * height * len(pil_image.getbands())
+
+
+def bucket_size(size, step):
+    """Round a (width, height) to the nearest multiple of step
+
+    Near-identical requested sizes then share one resized image.
+    A step of 1 (or less) keeps sizes exact.
+    """
+    if step <= 1:
+        return tuple(size)
+    return tuple(max(step, int(value / step + 0.5) * step) for value in size)
+
+
+class ImageCache:
+    """LRU cache that evicts least recently used images over a byte budget
+
+    Each entry is charged the pixel-buffer size of its source image
+    (light and dark modes share one buffer, so it is counted once).
+    """
+
+    def __init__(self, max_bytes=16 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()  # key -> (image, nbytes)
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        """Get an image and mark it most recently used, or None"""
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, key, image, nbytes):
+        """Add an image, evicting old entries to stay within the budget"""
+        if key in self.entries:
+            self.total_bytes -= self.entries.pop(key)[1]
+
+        self.entries[key] = (image, nbytes)
+        self.total_bytes += nbytes
+
+        # Always keep the newest entry, even if it alone exceeds the budget
+        while self.total_bytes > self.max_bytes and len(self.entries) > 1:
+            _, (_, evicted_bytes) = self.entries.popitem(last=False)
+            self.total_bytes -= evicted_bytes
+            self.evictions += 1
+
+    def set_budget(self, max_bytes):
+        """Change the byte budget, evicting immediately if needed"""
+        self.max_bytes = max_bytes
+        # Like put(), keep the newest entry even if it alone is over budget
+        while self.total_bytes > self.max_bytes and len(self.entries) > 1:
+            _, (_, evicted_bytes) = self.entries.popitem(last=False)
+            self.total_bytes -= evicted_bytes
+            self.evictions += 1
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def __len__(self):
+        return len(self.entries)
+
+    def clear(self):
+        """Drop every entry (counters are kept)"""
+        self.entries.clear()
+        self.total_bytes = 0
+
+    def stats(self):
+        """Hit/miss/eviction counters and memory use"""
+        return {
+            'entries': len(self.entries),
+            'bytes': self.total_bytes,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions
+        }
@@ -4,18 +4,65 @@ Handles loading and caching of location thumbnails and regional maps
 """
 
 import customtkinter as ctk
-from PIL import Image
+import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
 import os
+import queue
+from .image_cache import ImageCache, bucket_size, image_nbytes
+from .thumbnail_cache import ThumbnailCache
+
+# Color of the placeholder shown while an image loads in the background
+PLACEHOLDER_COLOR = (64, 64, 64)
+
+# How often (ms) the Tk thread collects finished background loads
+POLL_INTERVAL = 30
+
+
+def load_pil_image(image_path, size):
+    """Decode an image, flatten transparency onto white and resize it
+
+    Only touches PIL, so it is safe to run on a worker thread.
+    """
+    from PIL import Image
+
+    pil_image = Image.open(image_path)
+
+    # Convert GIF with transparency to RGB
+    if pil_image.mode in ('RGBA', 'LA', 'P'):
+        # Create white background
+        background = Image.new('RGB', pil_image.size, (255, 255, 255))
+        # Paste image on background
+        if pil_image.mode == 'RGBA':
+            background.paste(pil_image, mask=pil_image.split()[-1])
+        else:
+            background.paste(pil_image)
+        pil_image = background
+
+    # Resize to requested size
+    return pil_image.resize(size, Image.Resampling.LANCZOS)
 
 
 class ImageManager:
     """Manages loading and caching of location/map images"""
 
-    def __init__(self, image_dir="Images"):
+    def __init__(self, image_dir="Images", max_workers=2, thumbnail_dir="thumbnail_cache",
+                 max_cache_bytes=16 * 1024 * 1024, size_step=4):
         self.image_dir = image_dir
-        self.cache = {}
+        self.cache = ImageCache(max_cache_bytes)
+        self.size_step = size_step  # Requested sizes are rounded to this many pixels
         self.location_map = self._load_location_mapping()
 
+        # Resized images persisted across launches (None disables)
+        self.thumbnail_cache = ThumbnailCache(thumbnail_dir) if thumbnail_dir else None
+
+        # Background loading
+        self.max_workers = max_workers
+        self.executor = None       # Created on first background request
+        self.pending = {}          # cache_key -> callbacks waiting for the image
+        self.results = queue.Queue()
+        self.poll_job = None
+        self.poll_widget = None
+
     def _load_location_mapping(self):
         """Load mapping from placenames.txt and imagenames.txt"""
         mapping = {}
@@ -30,8 +77,9 @@ class ImageManager:
                 image_files = [line.strip() for line in f.readlines() if line.strip()]
 
             # Create mapping
+            # (imagenames.txt entries already carry the Images/ prefix)
             for place_name, image_file in zip(place_names, image_files):
-                full_path = os.path.join(self.image_dir, image_file)
+                full_path = os.path.join(self.image_dir, os.path.basename(image_file))
                 if os.path.exists(full_path):
                     mapping[place_name] = full_path
 
@@ -40,98 +88,189 @@ class ImageManager:
 
         return mapping
 
-    def get_location_image(self, location_name, size=(80, 60)):
-        """Get cached CTkImage for location thumbnail"""
-        cache_key = f"{location_name}_{size[0]}x{size[1]}"
+    def _location_request(self, location_name, size):
+        """Cache key, source path and bucketed size for a location thumbnail"""
+        size = bucket_size(size, self.size_step)
+        return f"{location_name}_{size[0]}x{size[1]}", self.location_map.get(location_name), size
 
+    def _map_request(self, region_name, size):
+        """Cache key, source path and bucketed size for a regional map"""
+        from .region_mapping import REGIONAL_MAPS
+        size = bucket_size(size, self.size_step)
+        return f"map_{region_name}_{size[0]}x{size[1]}", REGIONAL_MAPS.get(region_name), size
+
+    def _load_pil(self, image_path, size):
+        """Get a resized image from the disk cache, decoding only on a miss
+
+        Safe to call from worker threads.
+        """
+        if self.thumbnail_cache is None:
+            return load_pil_image(image_path, size)
+
+        pil_image = self.thumbnail_cache.load(image_path, size)
+        if pil_image is None:
+            pil_image = load_pil_image(image_path, size)
+            self.thumbnail_cache.store(image_path, size, pil_image)
+        return pil_image
+
+    def _make_ctk_image(self, pil_image, size):
+        """Wrap a PIL image for CustomTkinter (Tk thread only)"""
+        return ctk.CTkImage(
+            light_image=pil_image,
+            dark_image=pil_image,
+            size=size
+        )
+
+    def _load_sync(self, cache_key, image_path, size, label):
+        """Load, cache and return a CTkImage on the calling thread"""
         # Return from cache if available
-        if cache_key in self.cache:
-            return self.cache[cache_key]
+        ctk_image = self.cache.get(cache_key)
+        if ctk_image is not None:
+            return ctk_image
 
-        # Load image
-        image_path = self.location_map.get(location_name)
         if not image_path or not os.path.exists(image_path):
             return None
 
         try:
-            # Load with PIL
-            pil_image = Image.open(image_path)
-
-            # Convert GIF with transparency to RGB
-            if pil_image.mode in ('RGBA', 'LA', 'P'):
-                # Create white background
-                background = Image.new('RGB', pil_image.size, (255, 255, 255))
-                # Paste image on background
-                if pil_image.mode == 'RGBA':
-                    background.paste(pil_image, mask=pil_image.split()[-1])
-                else:
-                    background.paste(pil_image)
-                pil_image = background
-
-            # Resize to thumbnail
-            pil_image = pil_image.resize(size, Image.Resampling.LANCZOS)
-
-            # Create CTkImage
-            ctk_image = ctk.CTkImage(
-                light_image=pil_image,
-                dark_image=pil_image,
-                size=size
-            )
+            pil_image = self._load_pil(image_path, size)
+            ctk_image = self._make_ctk_image(pil_image, size)
 
             # Cache and return
-            self.cache[cache_key] = ctk_image
+            self.cache.put(cache_key, ctk_image, image_nbytes(pil_image))
             return ctk_image
 
         except Exception as e:
-            print(f"Error loading image for {location_name}: {e}")
+            print(f"Error loading image for {label}: {e}")
             return None
 
+    def get_location_image(self, location_name, size=(80, 60)):
+        """Get cached CTkImage for location thumbnail"""
+        cache_key, image_path, size = self._location_request(location_name, size)
+        return self._load_sync(cache_key, image_path, size, location_name)
+
     def get_regional_map(self, region_name, size=(400, 300)):
         """Get larger regional map image"""
-        from .region_mapping import REGIONAL_MAPS
+        cache_key, map_path, size = self._map_request(region_name, size)
+        return self._load_sync(cache_key, map_path, size, f"regional map {region_name}")
 
-        cache_key = f"map_{region_name}_{size[0]}x{size[1]}"
+    def get_placeholder(self, size):
+        """Get the flat image shown until a background load finishes"""
+        cache_key = f"placeholder_{size[0]}x{size[1]}"
+        placeholder = self.cache.get(cache_key)
+        if placeholder is None:
+            from PIL import Image
+            pil_image = Image.new('RGB', size, PLACEHOLDER_COLOR)
+            placeholder = self._make_ctk_image(pil_image, size)
+            self.cache.put(cache_key, placeholder, image_nbytes(pil_image))
+        return placeholder
 
-        # Return from cache if available
-        if cache_key in self.cache:
-            return self.cache[cache_key]
+    def get_location_image_async(self, widget, location_name, callback, size=(80, 60)):
+        """Get a location thumbnail without blocking the Tk thread
 
-        # Get map path
-        map_path = REGIONAL_MAPS.get(region_name)
-        if not map_path or not os.path.exists(map_path):
-            return None
+        Returns the cached image if there is one. Otherwise returns a
+        placeholder right away and later calls callback(ctk_image) on the
+        Tk thread once the image is decoded (ctk_image is None on failure).
+        """
+        cache_key, image_path, size = self._location_request(location_name, size)
+        return self._load_async(widget, cache_key, image_path, size, callback)
 
-        try:
-            # Load with PIL
-            pil_image = Image.open(map_path)
-
-            # Convert GIF with transparency
-            if pil_image.mode in ('RGBA', 'LA', 'P'):
-                background = Image.new('RGB', pil_image.size, (255, 255, 255))
-                if pil_image.mode == 'RGBA':
-                    background.paste(pil_image, mask=pil_image.split()[-1])
-                else:
-                    background.paste(pil_image)
-                pil_image = background
-
-            # Resize
-            pil_image = pil_image.resize(size, Image.Resampling.LANCZOS)
-
-            # Create CTkImage
-            ctk_image = ctk.CTkImage(
-                light_image=pil_image,
-                dark_image=pil_image,
-                size=size
-            )
+    def get_regional_map_async(self, widget, region_name, callback, size=(400, 300)):
+        """Get a regional map without blocking the Tk thread (see get_location_image_async)"""
+        cache_key, map_path, size = self._map_request(region_name, size)
+        return self._load_async(widget, cache_key, map_path, size, callback)
 
-            # Cache and return
-            self.cache[cache_key] = ctk_image
+    def prefetch_region(self, widget, region_name, size=(80, 60)):
+        """Warm the thumbnail cache for every location in a region"""
+        from .region_mapping import REGION_LOCATION_MAP
+
+        for location_name in REGION_LOCATION_MAP.get(region_name, []):
+            cache_key, image_path, bucketed = self._location_request(location_name, size)
+            if image_path and cache_key not in self.cache:
+                self._load_async(widget, cache_key, image_path, bucketed, None)
+
+    def _load_async(self, widget, cache_key, image_path, size, callback):
+        """Queue a background load, coalescing requests for the same image"""
+        ctk_image = self.cache.get(cache_key)
+        if ctk_image is not None:
             return ctk_image
 
-        except Exception as e:
-            print(f"Error loading regional map for {region_name}: {e}")
+        if not image_path or not os.path.exists(image_path):
             return None
 
-    def clear_cache(self):
-        """Clear image cache"""
+        if cache_key in self.pending:
+            if callback:
+                self.pending[cache_key].append(callback)
+            return self.get_placeholder(size)
+
+        self.pending[cache_key] = [callback] if callback else []
+
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="image-loader")
+        self.executor.submit(self._decode_worker, cache_key, image_path, size)
+
+        self._schedule_poll(widget)
+        return self.get_placeholder(size)
+
+    def _decode_worker(self, cache_key, image_path, size):
+        """Worker thread: decode and resize, hand the PIL image back"""
+        try:
+            pil_image = self._load_pil(image_path, size)
+        except Exception as e:
+            print(f"Error loading image {image_path}: {e}")
+            pil_image = None
+        self.results.put((cache_key, size, pil_image))
+
+    def _schedule_poll(self, widget):
+        """Make sure finished loads get collected on the Tk thread"""
+        self.poll_widget = widget
+        if self.poll_job is None:
+            self.poll_job = widget.after(POLL_INTERVAL, self._deliver_results)
+
+    def _deliver_results(self):
+        """Tk thread: wrap finished images, cache them and run callbacks"""
+        self.poll_job = None
+
+        while True:
+            try:
+                cache_key, size, pil_image = self.results.get_nowait()
+            except queue.Empty:
+                break
+
+            ctk_image = None
+            if pil_image is not None:
+                ctk_image = self._make_ctk_image(pil_image, size)
+                self.cache.put(cache_key, ctk_image, image_nbytes(pil_image))
+
+            for callback in self.pending.pop(cache_key, []):
+                callback(ctk_image)
+
+        # Keep polling while loads are still in flight
+        if self.pending and self.poll_widget is not None:
+            try:
+                self.poll_job = self.poll_widget.after(POLL_INTERVAL, self._deliver_results)
+            except tk.TclError:
+                # Widget was destroyed; nothing left to deliver to
+                self.pending.clear()
+
+    def shutdown(self):
+        """Stop background loading"""
+        if self.poll_job is not None and self.poll_widget is not None:
+            try:
+                self.poll_widget.after_cancel(self.poll_job)
+            except tk.TclError:
+                pass
+            self.poll_job = None
+        if self.executor is not None:
+            self.executor.shutdown(wait=False)
+            self.executor = None
+        self.pending.clear()
+
+    def get_cache_stats(self):
+        """Memory cache hit/miss/eviction counters and byte usage"""
+        return self.cache.stats()
+
+    def clear_cache(self, include_disk=False):
+        """Clear image cache (and optionally the on-disk thumbnails)"""
         self.cache.clear()
+        if include_disk and self.thumbnail_cache is not None:
+            self.thumbnail_cache.clear()
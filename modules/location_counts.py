@@ -0,0 +1,113 @@
+"""
+Place button counters for the legacy Fantasy Life Quest Tracker
+Keeps the Unobtained / Obtained / Completed / Turned In count of every
+place from a bit-packed quest x place incidence matrix
+"""
+
+from array import array
+from operator import itemgetter
+from .quest_index import popcount
+
+OBTAINED = 1
+NO_QUEST = 255  # Status byte of rows without a quest
+
+# bytes.translate tables turning a status byte into b'1' and the rest into b'0'
+_MATCH = {value: bytes(49 if byte == value else 48 for byte in range(256))
+          for value in (0, 1, 2, 3, NO_QUEST)}
+
+
+def rows_with(statuses, value):
+    """Int bitset of the rows whose status byte is value, without a per-row loop"""
+    if not statuses:
+        return 0
+    return int(statuses.translate(_MATCH[value])[::-1], 2)
+
+
+class LocationCounts:
+    """Status histogram of every place button
+
+    A quest counts towards its turn-in place while unobtained, completed
+    or turned in, and towards every place it is available at while
+    obtained. Both relations are stored as one int bitset over row numbers
+    per place (the columns of the incidence matrix), compiled once into
+    the quest snapshot; the statuses are four more bitsets, so a histogram
+    is a popcount of two ANDed bitsets. A status change is applied as a
+    delta to just the places in the quest's matrix row.
+    """
+
+    def __init__(self, place_count, all_place, lives_place):
+        self.place_count = place_count
+        self.all_place = all_place        # Counts every quest
+        self.lives_place = lives_place    # Counts every Life quest
+        self.rows = 0                     # Bitset of the rows that hold a quest
+        self.turn_in_bits = [0] * place_count
+        self.location_bits = [0] * place_count
+        self.status_bits = [0, 0, 0, 0]
+        self.row_places = {}   # row -> (places while not obtained, places while obtained)
+        self.counts = []       # place -> array('i') of the four status counts
+
+    def build(self, quests, turn_in_bits, location_bits, life_bits):
+        """Count the quest cache's statuses over the matrix from QuestSnapshot.place_matrix()
+
+        quests must be in row order, as quest_cache is.
+        """
+        size = quests[-1]['row'] + 1 if quests else 0
+
+        # One status byte per row, then one bitset per status
+        first = quests[0]['row'] if quests else 0
+        if size - first == len(quests):
+            # Contiguous rows (the sheet's layout): no per-row indexing
+            statuses = bytes([NO_QUEST]) * first + bytes(map(itemgetter('status'), quests))
+        else:
+            statuses = bytearray([NO_QUEST]) * size
+            for quest in quests:
+                statuses[quest['row']] = quest['status']
+        self.status_bits = [rows_with(statuses, status) for status in range(len(self.status_bits))]
+        self.rows = rows_with(statuses, NO_QUEST) ^ ((1 << size) - 1)
+
+        self.turn_in_bits = [bits & self.rows for bits in turn_in_bits]
+        self.location_bits = [bits & self.rows for bits in location_bits]
+        self.turn_in_bits[self.all_place] = self.location_bits[self.all_place] = self.rows
+        self.turn_in_bits[self.lives_place] |= life_bits & self.rows
+        self.location_bits[self.lives_place] |= life_bits & self.rows
+
+        # Every place's histogram (see histogram()), without a call per place
+        unobtained, obtained, completed, turned_in = self.status_bits
+        self.row_places = {}
+        self.counts = [array('i', (popcount(turn_in & unobtained), popcount(available & obtained),
+                                   popcount(turn_in & completed), popcount(turn_in & turned_in)))
+                       for turn_in, available in zip(self.turn_in_bits, self.location_bits)]
+
+    def histogram(self, place):
+        """Count of each status at a place, straight from the bitsets"""
+        return [popcount((self.location_bits if status == OBTAINED else self.turn_in_bits)[place]
+                         & self.status_bits[status])
+                for status in range(len(self.status_bits))]
+
+    def matrix_row(self, row):
+        """The places a row counts towards while not obtained and while obtained"""
+        places = self.row_places.get(row)
+        if places is None:
+            places = ([place for place, bits in enumerate(self.turn_in_bits) if bits >> row & 1],
+                      [place for place, bits in enumerate(self.location_bits) if bits >> row & 1])
+            self.row_places[row] = places
+        return places
+
+    def change(self, row, old, new):
+        """Apply a status change and return the places whose counts changed"""
+        if old == new or not self.rows >> row & 1:
+            return []
+
+        bit = 1 << row
+        self.status_bits[old] &= ~bit
+        self.status_bits[new] |= bit
+
+        places = self.matrix_row(row)
+        changed = {}
+        for place in places[old == OBTAINED]:
+            self.counts[place][old] -= 1
+            changed[place] = None
+        for place in places[new == OBTAINED]:
+            self.counts[place][new] += 1
+            changed[place] = None
+        return list(changed)
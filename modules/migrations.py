@@ -0,0 +1,282 @@
+"""
+Schema migrations for the Fantasy Life Quest Tracker database
+Upgrades quest_tracker.db one version at a time, tracked in PRAGMA user_version
+"""
+
+import sqlite3
+import time
+from .constants import rank_ordinal
+
+# (version, description, step) in the order they are applied; see migration()
+MIGRATIONS = []
+
+# Junction tables keyed by (quest_id, value): looking up a quest's rows is
+# a primary key search and a quest cannot list the same value twice
+JUNCTION_TABLES = (('quest_locations', 'location'), ('quest_tags', 'tag'))
+JUNCTION_TABLE_SQL = '''
+    CREATE TABLE IF NOT EXISTS {table} (
+        quest_id INTEGER NOT NULL,
+        {column} TEXT NOT NULL,
+        PRIMARY KEY (quest_id, {column}),
+        FOREIGN KEY (quest_id) REFERENCES quests(row_id)
+    ) WITHOUT ROWID
+'''
+
+SEARCH_TRIGGERS = (
+    '''CREATE TRIGGER IF NOT EXISTS quests_search_insert AFTER INSERT ON quests BEGIN
+        DELETE FROM quest_search WHERE rowid = new.row_id;
+        INSERT INTO quest_search (rowid, name, life, giver, description, note)
+        VALUES (new.row_id, new.name, new.life, new.giver, new.description,
+                (SELECT note FROM quest_notes WHERE quest_id = new.row_id));
+    END''',
+    '''CREATE TRIGGER IF NOT EXISTS quests_search_update
+    AFTER UPDATE OF name, life, giver, description ON quests BEGIN
+        UPDATE quest_search
+        SET name = new.name, life = new.life, giver = new.giver, description = new.description
+        WHERE rowid = new.row_id;
+    END''',
+    '''CREATE TRIGGER IF NOT EXISTS quests_search_delete AFTER DELETE ON quests BEGIN
+        DELETE FROM quest_search WHERE rowid = old.row_id;
+    END''',
+    '''CREATE TRIGGER IF NOT EXISTS notes_search_insert AFTER INSERT ON quest_notes BEGIN
+        UPDATE quest_search SET note = new.note WHERE rowid = new.quest_id;
+    END''',
+    '''CREATE TRIGGER IF NOT EXISTS notes_search_update AFTER UPDATE ON quest_notes BEGIN
+        UPDATE quest_search SET note = new.note WHERE rowid = new.quest_id;
+    END''',
+    '''CREATE TRIGGER IF NOT EXISTS notes_search_delete AFTER DELETE ON quest_notes BEGIN
+        UPDATE quest_search SET note = NULL WHERE rowid = old.quest_id;
+    END'''
+)
+
+
+def migration(version, description):
+    """Register a migration step; steps must be idempotent, since databases
+    from before user_version was tracked may already have part of the schema"""
+    def register(step):
+        MIGRATIONS.append((version, description, step))
+        MIGRATIONS.sort(key=lambda entry: entry[0])
+        return step
+    return register
+
+
+def schema_version(conn):
+    return conn.execute('PRAGMA user_version').fetchone()[0]
+
+
+def latest_version():
+    return MIGRATIONS[-1][0] if MIGRATIONS else 0
+
+
+def migrate(conn, log=None):
+    """Apply every migration newer than the database, each in its own transaction
+
+    Returns the versions applied. A failed step is rolled back and raised;
+    the steps before it stay applied. Step timings are passed to log (e.g.
+    print) when given; nothing is reported by default.
+    """
+    current = schema_version(conn)
+    if current > latest_version():
+        (log or print)(f"Warning: quest database is version {current}, newer than this tracker "
+            f"(version {latest_version()})")
+        return []
+
+    applied = []
+    started = time.perf_counter()
+    for version, description, step in MIGRATIONS:
+        if version <= current:
+            continue
+
+        step_started = time.perf_counter()
+        # IMMEDIATE takes the write lock first, so another connection
+        # opening the same database cannot apply the same step meanwhile
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            if schema_version(conn) >= version:
+                conn.rollback()
+                continue
+            step(conn)
+            conn.execute(f'PRAGMA user_version = {int(version)}')
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+
+        applied.append(version)
+        if log:
+            log(f"Migrated quest database to version {version} ({description}) "
+                f"in {(time.perf_counter() - step_started) * 1000:.1f} ms")
+
+    if applied and log:
+        log(f"Quest database migrations done in {(time.perf_counter() - started) * 1000:.1f} ms")
+    return applied
+
+
+def _table_sql(conn, name):
+    row = conn.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (name,)).fetchone()
+    return row[0] if row else None
+
+
+def _has_rows(conn, table):
+    return conn.execute(f'SELECT EXISTS (SELECT 1 FROM {table})').fetchone()[0]
+
+
+@migration(1, "base tables")
+def create_base_tables(conn):
+    # Quest data table
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS quests (
+            row_id INTEGER PRIMARY KEY,
+            status INTEGER DEFAULT 0,
+            name TEXT,
+            life TEXT,
+            rank TEXT,        -- Quest rank (Novice, Apprentice, Master, etc.)
+            giver TEXT,       -- NPC/Quest Giver name
+            description TEXT,
+            turn_in TEXT,
+            url TEXT,
+            last_modified TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+
+    # Quest locations and tags (many-to-many)
+    for table, column in JUNCTION_TABLES:
+        conn.execute(JUNCTION_TABLE_SQL.format(table=table, column=column))
+
+    # Quest notes
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS quest_notes (
+            quest_id INTEGER PRIMARY KEY,
+            note TEXT,
+            FOREIGN KEY (quest_id) REFERENCES quests(row_id)
+        )
+    ''')
+
+    # Statistics
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS statistics (
+            date TEXT PRIMARY KEY,
+            completed_count INTEGER DEFAULT 0,
+            turned_in_count INTEGER DEFAULT 0
+        )
+    ''')
+
+
+@migration(2, "WITHOUT ROWID junction tables and covering indexes")
+def upgrade_indexes(conn):
+    # Older versions created rowid junction tables; rebuild them, dropping
+    # duplicate rows
+    for table, column in JUNCTION_TABLES:
+        if 'WITHOUT ROWID' in _table_sql(conn, table).upper():
+            continue
+        conn.execute(f'ALTER TABLE {table} RENAME TO {table}_old')
+        conn.execute(JUNCTION_TABLE_SQL.format(table=table, column=column))
+        conn.execute(f'''
+            INSERT OR IGNORE INTO {table} (quest_id, {column})
+            SELECT quest_id, {column} FROM {table}_old
+            WHERE quest_id IS NOT NULL AND {column} IS NOT NULL
+        ''')
+        conn.execute(f'DROP TABLE {table}_old')
+
+    # Indexes for the queries that still run in SQLite (filters and sorts
+    # are served by the quest index). idx_life is a prefix of
+    # idx_life_rank_status, and quest_id lookups use the primary keys
+    conn.execute('DROP INDEX IF EXISTS idx_life')
+    conn.execute('DROP INDEX IF EXISTS idx_quest_id')
+
+    # Covers the ProgressTracker GROUP BY life, rank, status
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_life_rank_status ON quests(life, rank, status)')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_status ON quests(status)')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_rank ON quests(rank)')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_giver ON quests(giver)')
+    # Secondary indexes of WITHOUT ROWID tables carry the primary key,
+    # so these cover "which quests are at location/have tag X"
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_location ON quest_locations(location)')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_tag ON quest_tags(tag)')
+
+    # Give the planner statistics for the new indexes on existing data
+    if _has_rows(conn, 'quests'):
+        conn.execute('ANALYZE')
+
+
+@migration(3, "full-text search index")
+def create_search_index(conn):
+    if _table_sql(conn, 'quest_search') is None:
+        # Trigram matches substrings like LIKE '%term%'; older SQLite
+        # versions only have word tokenizers, searched by prefix instead
+        for candidate in ('trigram', 'unicode61'):
+            try:
+                conn.execute(f'''
+                    CREATE VIRTUAL TABLE quest_search USING fts5(
+                        name, life, giver, description, note,
+                        tokenize = '{candidate}'
+                    )
+                ''')
+                break
+            except sqlite3.OperationalError:
+                continue
+        else:
+            # SQLite built without FTS5; searches use the LIKE-style path and
+            # ensure_search_index() tries again on every start
+            return
+
+    for trigger in SEARCH_TRIGGERS:
+        conn.execute(trigger)
+
+    # Fill the table for databases created before it existed
+    if not _has_rows(conn, 'quest_search'):
+        conn.execute('''
+            INSERT INTO quest_search (rowid, name, life, giver, description, note)
+            SELECT q.row_id, q.name, q.life, q.giver, q.description, n.note
+            FROM quests q LEFT JOIN quest_notes n ON n.quest_id = q.row_id
+        ''')
+
+
+@migration(4, "rank ordinal column")
+def add_rank_ordinal(conn):
+    columns = [row[1] for row in conn.execute('PRAGMA table_info(quests)')]
+    if 'rank_ord' not in columns:
+        conn.execute('ALTER TABLE quests ADD COLUMN rank_ord INTEGER')
+
+    register_functions(conn)
+    conn.execute('UPDATE quests SET rank_ord = rank_ordinal(rank)')
+
+    # Rank sorts and the ProgressTracker breakdown order by rank_ord
+    conn.execute('DROP INDEX IF EXISTS idx_rank')
+    conn.execute('DROP INDEX IF EXISTS idx_life_rank_status')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_rank_ord_name ON quests(rank_ord, name)')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_life_rank_ord_status ON quests(life, rank_ord, rank, status)')
+
+    if _has_rows(conn, 'quests'):
+        conn.execute('ANALYZE')
+
+
+def register_functions(conn):
+    """SQL functions the schema relies on (rank_ordinal keeps rank_ord in sync on import)"""
+    conn.create_function('rank_ordinal', 1, rank_ordinal, deterministic=True)
+
+
+def search_tokenizer(conn):
+    """Tokenizer of the quest_search table ('trigram' or 'unicode61'), or None without FTS5"""
+    sql = _table_sql(conn, 'quest_search')
+    if sql is None:
+        return None
+    return 'trigram' if 'trigram' in sql else 'unicode61'
+
+
+def ensure_search_index(conn):
+    """Tokenizer of the quest_search table, creating it first if it is missing
+
+    A database migrated by a SQLite without FTS5 is at version 3 or later
+    but has no search table; this adds it once the SQLite in use has FTS5.
+    Returns None if it still does not.
+    """
+    if search_tokenizer(conn) is None and schema_version(conn) >= 3:
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            create_search_index(conn)
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+    return search_tokenizer(conn)
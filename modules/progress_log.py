@@ -0,0 +1,111 @@
+"""
+Progress log for the legacy Fantasy Life Quest Tracker
+Keeps currentprogress.txt as the snapshot and records status changes in an
+append-only log, compacting the log back into the snapshot periodically
+"""
+
+import array
+import os
+from datetime import datetime
+
+# Log entries written before the log is folded back into the snapshot
+DEFAULT_COMPACT_EVERY = 200
+
+
+class ProgressLog:
+    """currentprogress.txt plus an append-only change log
+
+    The snapshot keeps its one-status-per-line text format. Each status
+    change appends one "row status timestamp" line to the log (O(1) and
+    fsynced, so it survives crashes); loading replays the log over the
+    snapshot. Optionally the statuses are also kept as a packed binary
+    array (array('b')), which loads without parsing text.
+    """
+
+    def __init__(self, progress_file="currentprogress.txt", log_file=None,
+                 binary_file=None, compact_every=DEFAULT_COMPACT_EVERY):
+        self.progress_file = progress_file
+        self.log_file = log_file or os.path.splitext(progress_file)[0] + ".log"
+        self.binary_file = binary_file   # None disables the binary copy
+        self.compact_every = compact_every
+        self.data = []          # One status string per line, like the snapshot
+        self.log = None         # Open append handle
+        self.log_entries = 0    # Entries in the log since the last compaction
+
+    def load(self):
+        """Read the snapshot, replay the log and return the status lines"""
+        self.data = self._load_binary()
+        if self.data is None:
+            with open(self.progress_file, "r") as f:
+                self.data = f.read().splitlines()
+
+        self.log_entries = 0
+        if os.path.exists(self.log_file):
+            with open(self.log_file, "r") as f:
+                for line in f:
+                    parts = line.split()
+                    try:
+                        row, status = int(parts[0]), int(parts[1])
+                    except (IndexError, ValueError):
+                        break  # Torn final line from a crash mid-write
+                    if 0 <= row < len(self.data):
+                        self.data[row] = str(status)
+                    self.log_entries += 1
+
+        return self.data
+
+    def _load_binary(self):
+        """Statuses from the binary copy, if it is at least as new as the text file"""
+        if not self.binary_file or not os.path.exists(self.binary_file):
+            return None
+        if os.path.getmtime(self.binary_file) < os.path.getmtime(self.progress_file):
+            return None  # Text file was edited by hand since
+
+        statuses = array.array('b')
+        with open(self.binary_file, "rb") as f:
+            statuses.frombytes(f.read())
+        return [str(status) for status in statuses]
+
+    def record(self, row, status):
+        """Append one status change, compacting once the log has grown"""
+        if self.log is None:
+            self.log = open(self.log_file, "a")
+        self.log.write("%d %d %s\n" % (row, status, datetime.now().isoformat(timespec='seconds')))
+        self.log.flush()
+        os.fsync(self.log.fileno())
+
+        self.log_entries += 1
+        if self.log_entries >= self.compact_every:
+            self.compact()
+
+    def compact(self, data=None):
+        """Rewrite the snapshot from the current statuses and empty the log"""
+        if data is not None:
+            self.data = data
+
+        self._replace(self.progress_file, "w", "".join("%s\n" % line for line in self.data))
+        if self.binary_file:
+            statuses = array.array('b', (int(line) for line in self.data))
+            self._replace(self.binary_file, "wb", statuses.tobytes())
+
+        # Replaying entries already in the snapshot is harmless, so the
+        # log is only emptied once the new snapshot is in place
+        if self.log is not None:
+            self.log.close()
+            self.log = None
+        if os.path.exists(self.log_file):
+            os.remove(self.log_file)
+        self.log_entries = 0
+
+    def _replace(self, path, mode, content):
+        """Write a file next to path and swap it in atomically"""
+        temp_path = path + ".tmp"
+        with open(temp_path, mode) as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+
+    def close(self):
+        """Fold the log into the snapshot"""
+        self.compact()
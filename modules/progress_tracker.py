@@ -1,78 +1,109 @@
 """
 Progress Tracker for Fantasy Life Quest Tracker
-Calculates and caches Life progress data
+Maintains Life progress counters from a single aggregate query
 """
 
-import time
-from .constants import RANK_ORDER
+from .constants import LIVES, RANK_ORDINALS, STATUS_NAMES
+
+# Quest counts per (life, rank, status), ranks in progression order;
+# idx_life_rank_ord_status covers it, grouping and ordering included
+COUNTS_QUERY = '''
+    SELECT life, rank, status, COUNT(*) as count
+    FROM quests
+    WHERE life IS NOT NULL
+    GROUP BY life, rank_ord, rank, status
+    ORDER BY life, rank_ord, rank, status
+'''
 
 
 class ProgressTracker:
-    """Calculates and caches Life progress data"""
+    """Calculates and caches Life progress data
+
+    Quest counts per (life, rank, status) are loaded in one grouped query
+    and then kept current by applying status change deltas. Every change
+    bumps a version number; cached progress is reused until the version
+    of its Life moves on.
+    """
 
     def __init__(self, database):
         self.db = database
-        self.cache = {}
-        self.cache_timestamp = None
+        self.counts = {}          # life -> rank (in rank order) -> [quest count per status]
+        self.version = 0          # Bumped on every change to the counters
+        self.life_versions = {}   # life -> version of its last change
+        self.cache = {}           # life -> (version, progress)
+        self.load_counts()
+
+    def load_counts(self):
+        """Fill every Life and rank bucket in one pass over the quests table"""
+        self.db.flush()  # Count queued status edits too
+        cursor = self.db.conn.cursor()
+        cursor.execute(COUNTS_QUERY)
+
+        self.counts = {}
+        for row in cursor.fetchall():
+            buckets = self.counts.setdefault(row['life'], {})
+            statuses = buckets.setdefault(row['rank'], [0] * len(STATUS_NAMES))
+            statuses[row['status']] += row['count']
+
+        self.version += 1
+        self.life_versions = {life: self.version for life in self.counts}
+        self.cache.clear()
+
+    def apply_status_changes(self, changes):
+        """Update counters from (quest, old_status) pairs instead of recomputing"""
+        changed_lives = set()
+        for quest, old_status in changes:
+            life = quest['life']
+            new_status = quest['status']
+            if life is None or old_status == new_status:
+                continue
+
+            statuses = self.counts.setdefault(life, {}).setdefault(quest['rank'], [0] * len(STATUS_NAMES))
+            statuses[old_status] -= 1
+            statuses[new_status] += 1
+            changed_lives.add(life)
+
+        if changed_lives:
+            self.version += 1
+            for life in changed_lives:
+                self.life_versions[life] = self.version
+
+        return changed_lives
 
     def get_life_progress(self, life_name):
         """Get progress for specific Life with caching"""
-        # Check cache (valid for 1 second)
-        if self.cache_timestamp and (time.time() - self.cache_timestamp < 1):
-            if life_name in self.cache:
-                return self.cache[life_name]
+        version = self.life_versions.get(life_name, 0)
+        cached = self.cache.get(life_name)
+        if cached and cached[0] == version:
+            return cached[1]
 
-        # Calculate progress
         progress = self._calculate_life_progress(life_name)
-
-        # Cache result
-        self.cache[life_name] = progress
-        self.cache_timestamp = time.time()
-
+        self.cache[life_name] = (version, progress)
         return progress
 
     def _calculate_life_progress(self, life_name):
-        """Calculate completion progress for a Life"""
-        cursor = self.db.conn.cursor()
+        """Calculate completion progress for a Life from the counters"""
+        buckets = self.counts.get(life_name, {})
 
-        # Get total and completed quests for this Life
-        cursor.execute('''
-            SELECT
-                COUNT(*) as total,
-                SUM(CASE WHEN status >= 2 THEN 1 ELSE 0 END) as completed
-            FROM quests
-            WHERE life = ?
-        ''', (life_name,))
-
-        result = cursor.fetchone()
-        total = result['total'] if result else 0
-        completed = result['completed'] if result and result['completed'] else 0
-        percentage = (completed / total * 100) if total > 0 else 0
+        total = 0
+        completed = 0
+        rank_progress = []
 
-        # Get rank breakdown
-        cursor.execute('''
-            SELECT
-                rank,
-                COUNT(*) as total,
-                SUM(CASE WHEN status >= 2 THEN 1 ELSE 0 END) as completed
-            FROM quests
-            WHERE life = ?
-            GROUP BY rank
-        ''', (life_name,))
+        # Buckets were loaded in rank order, unknown ranks last
+        for rank_name, statuses in buckets.items():
+            rank_total = sum(statuses)
+            rank_completed = sum(statuses[2:])
+            total += rank_total
+            completed += rank_completed
 
-        rank_progress = []
-        rank_data = cursor.fetchall()
-
-        # Sort ranks by RANK_ORDER
-        for rank_name in RANK_ORDER:
-            for row in rank_data:
-                if row['rank'] == rank_name:
-                    rank_progress.append({
-                        'rank': row['rank'],
-                        'total': row['total'],
-                        'completed': row['completed'] if row['completed'] else 0
-                    })
-                    break
+            if rank_name in RANK_ORDINALS:
+                rank_progress.append({
+                    'rank': rank_name,
+                    'total': rank_total,
+                    'completed': rank_completed
+                })
+
+        percentage = (completed / total * 100) if total > 0 else 0
 
         return {
             'total': total,
@@ -83,8 +114,6 @@ class ProgressTracker:
 
     def get_all_progress(self):
         """Get progress for all Lives"""
-        from .constants import LIVES
-
         all_progress = {}
         for life_name, _ in LIVES:
             all_progress[life_name] = self.get_life_progress(life_name)
@@ -92,6 +121,5 @@ class ProgressTracker:
         return all_progress
 
     def invalidate_cache(self):
-        """Clear cache when quest status changes"""
-        self.cache.clear()
-        self.cache_timestamp = None
+        """Reload the counters after changes made outside apply_status_changes"""
+        self.load_counts()
@@ -0,0 +1,343 @@
+"""
+In-memory quest index for Fantasy Life Quest Tracker
+Serves filters and sorts from resident arrays instead of SQL queries
+"""
+
+from array import array
+from .region_mapping import REGION_LOCATION_MAP
+
+# Search field -> quest columns it covers
+SEARCH_FIELDS = {
+    'Name': ('name',),
+    'Life': ('life',),
+    'NPC': ('giver',),
+    'Description': ('description',),
+    'All': ('name', 'life', 'giver', 'description')
+}
+
+QUEST_COLUMNS = ('row_id', 'status', 'name', 'life', 'rank', 'giver',
+                 'description', 'turn_in', 'url', 'last_modified')
+
+
+def popcount(bits):
+    """Number of set bits in an int bitset"""
+    return bin(bits).count("1")
+
+
+if hasattr(int, 'bit_count'):  # Python 3.10+
+    popcount = int.bit_count
+
+
+def iter_bits(bits):
+    """Yield the positions of the set bits in ascending order"""
+    while bits:
+        lowest = bits & -bits
+        yield lowest.bit_length() - 1
+        bits ^= lowest
+
+
+def _text_key(value):
+    """Order like SQLite: NULLs first, then by text"""
+    return (0, "") if value is None else (1, str(value))
+
+
+class QuestIndex:
+    """Resident, array-backed copy of the quests table
+
+    Each quest gets a position (its index in row_id order). Status, Life,
+    location, region and tag filters are int bitsets over those positions,
+    and the sort options are precomputed permutations of them. Status
+    counts per location and region are kept up to date as statuses
+    change. SQLite remains the persistence layer; QuestDatabase writes
+    through to this index.
+    """
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.load()
+
+    def load(self):
+        """Read every quest, location and tag once and build the index"""
+        cursor = self.conn.cursor()
+        cursor.execute(f"SELECT {', '.join(QUEST_COLUMNS)} FROM quests ORDER BY row_id")
+
+        self.records = []       # position -> quest dict
+        self.positions = {}     # row_id -> position
+        self.status = array('b')
+        self.search_text = {column: [] for column in SEARCH_FIELDS['All']}
+
+        for row in cursor.fetchall():
+            record = dict(row)
+            self.positions[record['row_id']] = len(self.records)
+            self.records.append(record)
+            self.status.append(record['status'])
+            for column, values in self.search_text.items():
+                values.append((record[column] or "").lower())
+
+        self.all_bits = (1 << len(self.records)) - 1
+
+        # Filter bitsets
+        self.status_bits = [0, 0, 0, 0]
+        self.life_bits = {}
+        for position, record in enumerate(self.records):
+            bit = 1 << position
+            self.status_bits[record['status']] |= bit
+            if record['life']:
+                self.life_bits[record['life']] = self.life_bits.get(record['life'], 0) | bit
+
+        self.location_bits = self._load_junction_bits('SELECT quest_id, location FROM quest_locations')
+        self.turn_in_bits = {}
+        for position, record in enumerate(self.records):
+            if record['turn_in']:
+                self.turn_in_bits[record['turn_in']] = self.turn_in_bits.get(record['turn_in'], 0) | (1 << position)
+        self._load_regions()
+
+        self.tag_bits = self._load_junction_bits('SELECT quest_id, tag FROM quest_tags')
+
+        # Sort permutations; the status order is derived from status_bits on
+        # demand and dropped whenever a status changes
+        positions = range(len(self.records))
+        self.sort_orders = {
+            'name': sorted(positions, key=lambda p: (_text_key(self.records[p]['name']), p)),
+            'life': sorted(positions, key=lambda p: (_text_key(self.records[p]['life']), p)),
+            'rank': self._load_rank_order(),
+        }
+        self._sort_last_modified()
+
+    def _load_junction_bits(self, query):
+        """Build value -> bitset from a (quest_id, value) junction table"""
+        bits = {}
+        cursor = self.conn.cursor()
+        cursor.execute(query)
+        for quest_id, value in cursor.fetchall():
+            position = self.positions.get(quest_id)
+            if position is not None:
+                bits[value] = bits.get(value, 0) | (1 << position)
+        return bits
+
+    def place_bits(self, place):
+        """Quests at a place of the location browser: available or turned in there"""
+        return self.location_bits.get(place, 0) | self.turn_in_bits.get(place, 0)
+
+    def _load_regions(self):
+        """Region bitsets and the per-place/per-region status counts"""
+        places = set(self.location_bits) | set(self.turn_in_bits)
+
+        self.region_bits = {}
+        for region, locations in REGION_LOCATION_MAP.items():
+            bits = 0
+            for location in locations:
+                bits |= self.all_bits if location == "All" else self.place_bits(location)
+            self.region_bits[region] = bits
+
+        # position -> the places and regions it counts towards, so a
+        # status change only touches those counters
+        self.quest_places = [[] for _ in self.records]
+        self.quest_regions = [[] for _ in self.records]
+        for place in places:
+            for position in iter_bits(self.place_bits(place)):
+                self.quest_places[position].append(place)
+        for region, bits in self.region_bits.items():
+            for position in iter_bits(bits):
+                self.quest_regions[position].append(region)
+
+        self.place_counts = {place: self._status_histogram(self.place_bits(place)) for place in places}
+        self.region_counts = {region: self._status_histogram(bits)
+                              for region, bits in self.region_bits.items()}
+
+    def _status_histogram(self, bits):
+        """Quest count per status within a bitset"""
+        return [popcount(bits & status_bits) for status_bits in self.status_bits]
+
+    def _load_rank_order(self):
+        """Positions by rank, then name: an index-ordered scan of idx_rank_ord_name"""
+        cursor = self.conn.cursor()
+        cursor.execute('SELECT row_id FROM quests ORDER BY rank_ord, name, row_id')
+        return [self.positions[row_id] for (row_id,) in cursor.fetchall()]
+
+    def _sort_last_modified(self):
+        """Rebuild the last_modified permutation"""
+        self.sort_orders['last_modified'] = sorted(
+            range(len(self.records)),
+            key=lambda p: (_text_key(self.records[p]['last_modified']), p)
+        )
+
+    def _status_order(self):
+        """Positions ordered by status, ties in row order"""
+        order = []
+        for bits in self.status_bits:
+            order.extend(iter_bits(bits))
+        return order
+
+    def get(self, row_id):
+        """Get the quest dict for a row_id"""
+        position = self.positions.get(row_id)
+        return self.records[position] if position is not None else None
+
+    def filter_bits(self, filters):
+        """Intersect the bitsets selected by status/life/location/place/region/tag filters"""
+        bits = self.all_bits
+        if not filters:
+            return bits
+
+        if filters.get('status') is not None and filters['status'] != 'all':
+            status = int(filters['status'])
+            bits &= self.status_bits[status] if 0 <= status < len(self.status_bits) else 0
+
+        if filters.get('life'):
+            bits &= self.life_bits.get(filters['life'], 0)
+
+        if filters.get('location'):
+            bits &= self.location_bits.get(filters['location'], 0)
+
+        if filters.get('place'):
+            bits &= self.place_bits(filters['place'])
+
+        if filters.get('region'):
+            bits &= self.region_bits.get(filters['region'], 0)
+
+        if filters.get('tag'):
+            bits &= self.tag_bits.get(filters['tag'], 0)
+
+        if filters.get('search_ids') is not None:
+            bits &= self._bits_for(filters['search_ids'])
+
+        return bits
+
+    def _bits_for(self, row_ids):
+        """Bitset of the given row_ids"""
+        bits = 0
+        for row_id in row_ids:
+            position = self.positions.get(row_id)
+            if position is not None:
+                bits |= 1 << position
+        return bits
+
+    def _search_matcher(self, filters):
+        """Case-insensitive substring test, like the former LIKE '%term%'"""
+        term = filters.get('search') if filters else None
+        if not term:
+            return None
+
+        term = term.lower()
+        columns = [self.search_text[column]
+                   for column in SEARCH_FIELDS.get(filters.get('search_field', 'Name'), ())]
+        return lambda p: any(term in values[p] for values in columns)
+
+    def query(self, filters=None):
+        """Get quests matching filters, ordered by filters['sort_by']"""
+        bits = self.filter_bits(filters)
+        matches = self._search_matcher(filters)
+
+        sort_by = filters.get('sort_by') if filters else None
+        if sort_by == 'status' and 'status' not in self.sort_orders:
+            self.sort_orders['status'] = self._status_order()
+
+        if sort_by in self.sort_orders:
+            order = self.sort_orders[sort_by]
+        elif sort_by in (None, 'relevance') and filters and filters.get('search_ids') is not None:
+            # Full-text results arrive best match first
+            order = [self.positions[row_id] for row_id in filters['search_ids'] if row_id in self.positions]
+        else:
+            order = range(len(self.records))
+
+        if bits == self.all_bits:
+            positions = order
+        else:
+            positions = (p for p in order if bits >> p & 1)
+        if matches:
+            positions = (p for p in positions if matches(p))
+
+        return [self.records[p] for p in positions]
+
+    def count(self, filters=None):
+        """Count quests matching status/life/location/place/region/tag filters"""
+        return popcount(self.filter_bits(filters))
+
+    def status_counts(self):
+        """Quest count per status"""
+        return [popcount(bits) for bits in self.status_bits]
+
+    def location_count(self, location):
+        """Quests available at a location ("All": available anywhere)"""
+        if location == "All":
+            bits = 0
+            for location_bits in self.location_bits.values():
+                bits |= location_bits
+            return popcount(bits)
+        return popcount(self.location_bits.get(location, 0))
+
+    def place_status_counts(self, place):
+        """Quest count per status at a place of the location browser ("All" covers every quest)"""
+        if place == "All":
+            return self.status_counts()
+        return list(self.place_counts.get(place, [0, 0, 0, 0]))
+
+    def region_status_counts(self, region):
+        """Quest count per status in a region"""
+        return list(self.region_counts.get(region, [0, 0, 0, 0]))
+
+    def places_of(self, row_ids):
+        """The places and regions whose counts include any of row_ids"""
+        places = set()
+        regions = set()
+        for row_id in row_ids:
+            position = self.positions.get(row_id)
+            if position is not None:
+                places.update(self.quest_places[position])
+                regions.update(self.quest_regions[position])
+        return places, regions
+
+    def update_status(self, row_ids, new_status, timestamp):
+        """Write-through for status changes
+
+        Returns a list of (quest, old_status) for every quest updated.
+        """
+        changes = []
+        moved = []
+        last_modified = str(timestamp)
+
+        order = self.sort_orders['last_modified']
+        newest = self.records[order[-1]]['last_modified'] if order else None
+
+        for row_id in row_ids:
+            position = self.positions.get(row_id)
+            if position is None:
+                continue
+
+            record = self.records[position]
+            old_status = self.status[position]
+            bit = 1 << position
+            self.status_bits[old_status] &= ~bit
+            self.status_bits[new_status] |= bit
+            self.status[position] = new_status
+            record['status'] = new_status
+
+            for place in self.quest_places[position]:
+                self.place_counts[place][old_status] -= 1
+                self.place_counts[place][new_status] += 1
+            for region in self.quest_regions[position]:
+                self.region_counts[region][old_status] -= 1
+                self.region_counts[region][new_status] += 1
+            record['last_modified'] = last_modified
+
+            changes.append((record, old_status))
+            moved.append(position)
+
+        if moved:
+            self.sort_orders.pop('status', None)
+
+            if newest is None or _text_key(last_modified) >= _text_key(newest):
+                # Updated quests are now the most recent: move them to the end
+                moved_set = set(moved)
+                order[:] = [p for p in order if p not in moved_set] + sorted(moved_set)
+            else:
+                self._sort_last_modified()
+
+        return changes
+
+    def add_tag(self, row_id, tag):
+        """Write-through for new tags"""
+        position = self.positions.get(row_id)
+        if position is not None:
+            self.tag_bits[tag] = self.tag_bits.get(tag, 0) | (1 << position)
@@ -0,0 +1,192 @@
+"""
+Quest data import/export for Fantasy Life Quest Tracker
+Streams quests to and from JSON or NDJSON files, optionally gzipped
+"""
+
+import gzip
+import json
+from .constants import STATUS_NAMES
+
+# Separates tags inside one group_concat value (not something users type)
+TAG_SEPARATOR = "\x1f"
+
+EXPORT_QUERY = '''
+    SELECT q.row_id, q.status, q.name, q.life, q.rank, q.giver,
+           q.description, q.turn_in, q.url, q.last_modified,
+           n.quest_id IS NOT NULL AS has_note, n.note,
+           (SELECT group_concat(tag, char(31)) FROM quest_tags t
+            WHERE t.quest_id = q.row_id) AS tags
+    FROM quests q
+    LEFT JOIN quest_notes n ON n.quest_id = q.row_id
+    ORDER BY q.row_id
+'''
+
+
+def is_ndjson(filename):
+    """NDJSON (one quest per line) is picked by a .ndjson or .jsonl name"""
+    name = filename.lower()
+    if name.endswith(".gz"):
+        name = name[:-3]
+    return name.endswith((".ndjson", ".jsonl"))
+
+
+def is_gzip(filename):
+    return filename.lower().endswith(".gz")
+
+
+def open_text(filename, mode, compress=None):
+    """Open a text file, through gzip when compress is set (default: by .gz name)"""
+    if compress is None:
+        compress = is_gzip(filename)
+    if compress:
+        return gzip.open(filename, mode + 't', encoding='utf-8')
+    return open(filename, mode, encoding='utf-8')
+
+
+def iter_export_rows(conn):
+    """Yield every quest with its note and tags, from a single query"""
+    cursor = conn.cursor()
+    cursor.execute(EXPORT_QUERY)
+    columns = [description[0] for description in cursor.description]
+
+    # Rows are fetched lazily, so memory use does not grow with the table
+    for row in cursor:
+        quest = dict(zip(columns, row))
+        has_note = quest.pop('has_note')
+        tags = quest.pop('tags')
+        quest['note'] = quest['note'] if has_note else ""
+        quest['tags'] = tags.split(TAG_SEPARATOR) if tags else []
+        yield quest
+
+
+def write_quests(quests, f, ndjson=False):
+    """Write quests one at a time
+
+    The JSON layout matches json.dump(quests, f, indent=2); NDJSON writes
+    one compact object per line. Returns the number of quests written.
+    """
+    count = 0
+    for quest in quests:
+        if ndjson:
+            f.write(json.dumps(quest, default=str))
+            f.write("\n")
+        else:
+            f.write("[\n  " if count == 0 else ",\n  ")
+            f.write(json.dumps(quest, indent=2, default=str).replace("\n", "\n  "))
+        count += 1
+
+    if not ndjson:
+        f.write("\n]" if count else "[]")
+    return count
+
+
+def export_quests(conn, filename, ndjson=None, compress=None):
+    """Stream every quest to filename; format and gzip default to the file name"""
+    if ndjson is None:
+        ndjson = is_ndjson(filename)
+
+    with open_text(filename, 'w', compress) as f:
+        return write_quests(iter_export_rows(conn), f, ndjson)
+
+
+def iter_json_values(f, chunk_size=64 * 1024):
+    """Yield the items of a top-level JSON array, or each value of an NDJSON stream
+
+    Reads the file in chunks and decodes one value at a time, so only the
+    current chunk and value are held in memory.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    pos = 0
+    eof = False
+
+    def read_more():
+        nonlocal buffer, pos, eof
+        chunk = f.read(chunk_size)
+        if not chunk:
+            eof = True
+            return False
+        buffer = buffer[pos:] + chunk
+        pos = 0
+        return True
+
+    def skip_whitespace():
+        nonlocal pos
+        while True:
+            while pos < len(buffer) and buffer[pos] in " \t\r\n":
+                pos += 1
+            if pos < len(buffer) or not read_more():
+                return
+
+    skip_whitespace()
+    if pos >= len(buffer):
+        return
+    in_array = buffer[pos] == '['
+    if in_array:
+        pos += 1
+
+    first = True
+    while True:
+        skip_whitespace()
+        if pos >= len(buffer):
+            if in_array:
+                raise ValueError("File ends inside the quest list")
+            return
+
+        if in_array:
+            if buffer[pos] == ']':
+                return
+            if not first:
+                if buffer[pos] != ',':
+                    raise ValueError(f"Expected ',' between quests, found {buffer[pos]!r}")
+                pos += 1
+                skip_whitespace()
+
+        while True:
+            try:
+                value, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if eof or not read_more():
+                    raise
+                continue
+            # A value running to the end of the chunk may continue in the next one
+            if end == len(buffer) and not eof and read_more():
+                continue
+            break
+
+        pos = end
+        first = False
+        yield value
+
+
+def iter_quest_records(filename, compress=None):
+    """Stream quest records from an export (JSON or NDJSON, plain or gzipped)"""
+    with open_text(filename, 'r', compress) as f:
+        yield from iter_json_values(f)
+
+
+def validate_quest(record):
+    """Describe what is wrong with an imported quest record, or None if it is usable"""
+    if not isinstance(record, dict):
+        return "not an object"
+
+    row_id = record.get('row_id')
+    if not isinstance(row_id, int) or isinstance(row_id, bool):
+        return "missing or invalid row_id"
+
+    status = record.get('status')
+    if status is not None and (not isinstance(status, int) or isinstance(status, bool)
+                               or not 0 <= status < len(STATUS_NAMES)):
+        return f"invalid status {status!r}"
+
+    if record.get('last_modified') is not None and not isinstance(record['last_modified'], str):
+        return "invalid last_modified"
+
+    if record.get('note') is not None and not isinstance(record['note'], str):
+        return "invalid note"
+
+    tags = record.get('tags')
+    if tags is not None and (not isinstance(tags, list) or not all(isinstance(tag, str) for tag in tags)):
+        return "invalid tags"
+
+    return None
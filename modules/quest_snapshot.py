@@ -0,0 +1,245 @@
+"""
+Quest data snapshot for Fantasy Life Quest Tracker
+Compiles FLData.xlsx, placenames.txt and imagenames.txt into a small
+SQLite file so neither app has to parse Excel at startup
+"""
+
+import hashlib
+import os
+import sqlite3
+
+# Bump when the snapshot layout changes
+SNAPSHOT_VERSION = 2
+
+DEFAULT_SNAPSHOT = "FLData.snapshot.db"
+DEFAULT_SOURCES = ("FLData.xlsx", "placenames.txt", "imagenames.txt")
+
+# Spreadsheet layout (1-based columns, row 1 is the header)
+FIRST_LOCATION_COL = 10
+LAST_LOCATION_COL = 50
+LAST_COL = 50
+
+# Spreadsheet column -> quest_rows column
+SHEET_COLUMNS = {
+    2: 'complete',
+    3: 'url',
+    4: 'giver',
+    5: 'life',
+    6: 'rank',
+    7: 'name',
+    8: 'description',
+    9: 'turn_in'
+}
+
+
+def source_hash(excel_file, placenames_file, imagenames_file):
+    """SHA-256 over the contents of every source file"""
+    digest = hashlib.sha256()
+    for path in (excel_file, placenames_file, imagenames_file):
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+def _read_lines(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read().splitlines()
+
+
+def _read_workbook(excel_file):
+    """Stream the quest sheet: returns (header values, data rows)"""
+    from openpyxl import load_workbook
+
+    wb = load_workbook(excel_file, read_only=True, data_only=True)
+    try:
+        rows = wb['Sheet1'].iter_rows(max_col=LAST_COL, values_only=True)
+        header = next(rows, ())
+        data = list(rows)
+    finally:
+        wb.close()
+
+    # Drop trailing blank rows; blank rows inside the data keep their row number
+    while data and all(value is None for value in data[-1]):
+        data.pop()
+
+    return header, data
+
+
+def build_snapshot(snapshot_file=DEFAULT_SNAPSHOT, excel_file=DEFAULT_SOURCES[0],
+                   placenames_file=DEFAULT_SOURCES[1], imagenames_file=DEFAULT_SOURCES[2]):
+    """Compile the source files into a snapshot (the only step that needs openpyxl)"""
+    import tempfile
+
+    header, rows = _read_workbook(excel_file)
+
+    def cell(values, column):
+        return values[column - 1] if column <= len(values) else None
+
+    # Write next to the target and swap in atomically
+    target_dir = os.path.dirname(os.path.abspath(snapshot_file))
+    fd, temp_path = tempfile.mkstemp(dir=target_dir, suffix=".tmp")
+    os.close(fd)
+
+    try:
+        conn = sqlite3.connect(temp_path)
+        cursor = conn.cursor()
+        cursor.executescript('''
+            CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+            CREATE TABLE sheet_header (col INTEGER PRIMARY KEY, value TEXT);
+            CREATE TABLE quest_rows (
+                row_id INTEGER PRIMARY KEY,
+                complete INTEGER,
+                url TEXT,
+                giver TEXT,
+                life TEXT,
+                rank TEXT,
+                name TEXT,
+                description TEXT,
+                turn_in TEXT
+            );
+            CREATE TABLE quest_locations (
+                quest_id INTEGER,
+                col INTEGER,
+                location TEXT,
+                PRIMARY KEY (quest_id, col)
+            ) WITHOUT ROWID;
+            CREATE TABLE places (idx INTEGER PRIMARY KEY, name TEXT, image TEXT);
+            CREATE TABLE place_bits (idx INTEGER PRIMARY KEY, turn_in BLOB, available BLOB);
+            CREATE TABLE row_sets (name TEXT PRIMARY KEY, bits BLOB);
+        ''')
+
+        cursor.executemany('INSERT INTO sheet_header VALUES (?, ?)',
+                           [(col, cell(header, col)) for col in range(1, LAST_COL + 1)])
+
+        places = list(zip(_read_lines(placenames_file), _read_lines(imagenames_file)))
+        place_index = {}
+        for idx, (name, _) in enumerate(places):
+            place_index.setdefault(name, idx)  # A repeated name counts at its first button
+
+        # Quest x place incidence matrix, one int bitset over row numbers per
+        # place and relation (see place_matrix())
+        turn_in_bits = [0] * len(places)
+        available_bits = [0] * len(places)
+        life_bits = 0
+
+        quests = []
+        locations = []
+        for row_idx, values in enumerate(rows, start=2):
+            fields = {field: cell(values, col) for col, field in SHEET_COLUMNS.items()}
+            quests.append((row_idx,) + tuple(fields.values()))
+
+            bit = 1 << row_idx
+            if fields['life'] is not None:
+                life_bits |= bit
+            if fields['turn_in'] in place_index:
+                turn_in_bits[place_index[fields['turn_in']]] |= bit
+
+            for col in range(FIRST_LOCATION_COL, LAST_LOCATION_COL + 1):
+                if cell(values, col) == 1 and cell(header, col):
+                    locations.append((row_idx, col, cell(header, col)))
+                    if cell(header, col) in place_index:
+                        available_bits[place_index[cell(header, col)]] |= bit
+
+        cursor.executemany('INSERT INTO quest_rows VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)', quests)
+        cursor.executemany('INSERT INTO quest_locations VALUES (?, ?, ?)', locations)
+        cursor.executemany('INSERT INTO places VALUES (?, ?, ?)',
+                           [(idx, name, image) for idx, (name, image) in enumerate(places)])
+
+        nbytes = (len(rows) + 2 + 7) // 8
+        cursor.executemany('INSERT INTO place_bits VALUES (?, ?, ?)', [
+            (idx, turn_in.to_bytes(nbytes, 'little'), available.to_bytes(nbytes, 'little'))
+            for idx, (turn_in, available) in enumerate(zip(turn_in_bits, available_bits))
+        ])
+        cursor.execute('INSERT INTO row_sets VALUES (?, ?)', ('life', life_bits.to_bytes(nbytes, 'little')))
+
+        cursor.executemany('INSERT INTO meta VALUES (?, ?)', [
+            ('version', str(SNAPSHOT_VERSION)),
+            ('source_hash', source_hash(excel_file, placenames_file, imagenames_file))
+        ])
+
+        conn.commit()
+        conn.close()
+        os.replace(temp_path, snapshot_file)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+    return snapshot_file
+
+
+def is_snapshot_current(snapshot_file=DEFAULT_SNAPSHOT, excel_file=DEFAULT_SOURCES[0],
+                        placenames_file=DEFAULT_SOURCES[1], imagenames_file=DEFAULT_SOURCES[2]):
+    """Check that a snapshot exists, has this layout and matches the sources"""
+    if not os.path.exists(snapshot_file):
+        return False
+
+    try:
+        conn = sqlite3.connect(snapshot_file)
+        try:
+            meta = dict(conn.execute('SELECT key, value FROM meta').fetchall())
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        return False
+
+    if meta.get('version') != str(SNAPSHOT_VERSION):
+        return False
+
+    try:
+        return meta.get('source_hash') == source_hash(excel_file, placenames_file, imagenames_file)
+    except OSError:
+        # Sources not shipped (e.g. a bundle with only the snapshot): trust it
+        return True
+
+
+def ensure_snapshot(snapshot_file=DEFAULT_SNAPSHOT, excel_file=DEFAULT_SOURCES[0],
+                    placenames_file=DEFAULT_SOURCES[1], imagenames_file=DEFAULT_SOURCES[2]):
+    """Get the path of an up-to-date snapshot, rebuilding it only when stale"""
+    if not is_snapshot_current(snapshot_file, excel_file, placenames_file, imagenames_file):
+        build_snapshot(snapshot_file, excel_file, placenames_file, imagenames_file)
+    return snapshot_file
+
+
+class QuestSnapshot:
+    """Read access to a compiled snapshot"""
+
+    def __init__(self, snapshot_file=DEFAULT_SNAPSHOT):
+        self.conn = sqlite3.connect(snapshot_file)
+        self.conn.row_factory = sqlite3.Row
+
+    def header(self):
+        """Spreadsheet header row as {column: title}"""
+        return dict(self.conn.execute('SELECT col, value FROM sheet_header').fetchall())
+
+    def quests(self):
+        """Quest rows in row order"""
+        return self.conn.execute('SELECT * FROM quest_rows ORDER BY row_id').fetchall()
+
+    def quest_locations(self):
+        """(quest_id, location) pairs, in spreadsheet column order per quest"""
+        return self.conn.execute(
+            'SELECT quest_id, location FROM quest_locations ORDER BY quest_id, col'
+        ).fetchall()
+
+    def places(self):
+        """(name, image) for every place button, in placenames.txt order"""
+        return [(row['name'], row['image'])
+                for row in self.conn.execute('SELECT name, image FROM places ORDER BY idx')]
+
+    def place_matrix(self):
+        """Quest x place incidence matrix as (turn_in, available, life)
+
+        turn_in[p] and available[p] are int bitsets over row numbers: the
+        quests turned in and available at place p (placenames.txt order).
+        life is the bitset of quests that belong to a Life.
+        """
+        rows = self.conn.execute('SELECT turn_in, available FROM place_bits ORDER BY idx').fetchall()
+        turn_in = [int.from_bytes(row[0], 'little') for row in rows]
+        available = [int.from_bytes(row[1], 'little') for row in rows]
+        life = self.conn.execute("SELECT bits FROM row_sets WHERE name = 'life'").fetchone()
+        return turn_in, available, int.from_bytes(life[0], 'little')
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,79 @@
+"""
+Thumbnail Cache for Fantasy Life Quest Tracker
+Keeps pre-resized, pre-flattened RGB thumbnails on disk between launches
+"""
+
+import hashlib
+import os
+
+
+class ThumbnailCache:
+    """On-disk cache of resized RGB images
+
+    Each entry is the raw RGB pixel buffer of one source image at one size,
+    so a warm load is a file read with no decoding or resampling. Entries
+    are keyed by source path, source mtime and target size; when a source
+    image changes, its old entries are replaced on the next store.
+    """
+
+    def __init__(self, cache_dir="thumbnail_cache"):
+        self.cache_dir = cache_dir
+
+    def _entry_prefix(self, image_path, size):
+        """File name prefix shared by every version of a (source, size) entry"""
+        source = hashlib.sha1(os.path.abspath(image_path).encode('utf-8')).hexdigest()[:16]
+        return f"{source}_{size[0]}x{size[1]}_"
+
+    def _entry_path(self, image_path, size):
+        """Cache file for the current version of a source image"""
+        mtime = os.stat(image_path).st_mtime_ns
+        return os.path.join(self.cache_dir, f"{self._entry_prefix(image_path, size)}{mtime}.rgb")
+
+    def load(self, image_path, size):
+        """Get the cached PIL image, or None if missing or stale"""
+        try:
+            entry_path = self._entry_path(image_path, size)
+            with open(entry_path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            return None
+
+        if len(data) != size[0] * size[1] * 3:
+            return None  # Truncated entry, rebuilt on the next store
+
+        from PIL import Image
+        return Image.frombytes('RGB', size, data)
+
+    def store(self, image_path, size, pil_image):
+        """Save a resized image, dropping entries for older versions of its source"""
+        import tempfile
+
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            entry_path = self._entry_path(image_path, size)
+
+            # Write to a temp file first so readers never see a partial entry
+            fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, 'wb') as f:
+                f.write(pil_image.convert('RGB').tobytes())
+            os.replace(temp_path, entry_path)
+
+            prefix = self._entry_prefix(image_path, size)
+            entry_name = os.path.basename(entry_path)
+            for name in os.listdir(self.cache_dir):
+                if name.startswith(prefix) and name != entry_name:
+                    os.remove(os.path.join(self.cache_dir, name))
+
+        except OSError as e:
+            # The cache is only an optimization
+            print(f"Warning: Could not cache thumbnail for {image_path}: {e}")
+
+    def clear(self):
+        """Delete every cached thumbnail"""
+        if not os.path.isdir(self.cache_dir):
+            return
+        for name in os.listdir(self.cache_dir):
+            try:
+                os.remove(os.path.join(self.cache_dir, name))
+            except OSError:
+                pass
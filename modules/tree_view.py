@@ -0,0 +1,109 @@
+"""
+Reconciling view layer for the quest Treeview
+Applies only the rows that changed between two result sets instead of
+clearing and re-inserting every item
+"""
+
+from .constants import STATUS_COLORS, STATUS_NAMES
+
+
+def quest_row(quest):
+    """Build the (values, tags) pair displayed for a quest"""
+    values = (
+        STATUS_NAMES[quest['status']],
+        quest['name'] or "",
+        quest['life'] or "",
+        quest['rank'] or "",   # Rank
+        quest['giver'] or "",  # NPC/Giver
+        quest['turn_in'] or ""
+    )
+    tags = (str(quest['row_id']), f"status_{quest['status']}")
+    return values, tags
+
+
+def diff_rows(current_rows, current_order, new_rows, new_order):
+    """Compare the displayed rows with a new result set
+
+    Rows are keyed by item id (the quest row_id as a string). Returns the
+    ids that must be inserted, the ids whose values or tags changed, and
+    whether the attached order differs from the new one.
+    """
+    inserts = []
+    updates = []
+    for iid in new_order:
+        old = current_rows.get(iid)
+        if old is None:
+            inserts.append(iid)
+        elif old != new_rows[iid]:
+            updates.append(iid)
+
+    reorder = bool(inserts) or tuple(current_order) != tuple(new_order)
+    return inserts, updates, reorder
+
+
+class QuestTreeView:
+    """Keeps a ttk.Treeview in sync with quest results, keyed by row_id"""
+
+    def __init__(self, tree):
+        self.tree = tree
+        self.rows = {}    # item id -> (values, tags) currently stored in the tree
+        self.order = ()   # item ids currently attached, in display order
+        self.configure_status_tags()
+
+    def configure_status_tags(self):
+        """Color code rows once per status instead of once per inserted row"""
+        for status, color in STATUS_COLORS.items():
+            self.tree.tag_configure(f"status_{status}", background=color, foreground="black")
+
+    def render(self, quests):
+        """Show exactly the given quests, in order, touching only changed rows"""
+        new_rows = {}
+        new_order = []
+        for quest in quests:
+            iid = str(quest['row_id'])
+            new_rows[iid] = quest_row(quest)
+            new_order.append(iid)
+
+        inserts, updates, reorder = diff_rows(self.rows, self.order, new_rows, new_order)
+
+        for iid in inserts:
+            values, tags = new_rows[iid]
+            if self.tree.exists(iid):
+                # Hidden by an earlier filter, bring its values up to date
+                self.tree.item(iid, values=values, tags=tags)
+            else:
+                self.tree.insert("", "end", iid=iid, values=values, tags=tags)
+            self.rows[iid] = new_rows[iid]
+
+        for iid in updates:
+            values, tags = new_rows[iid]
+            self.tree.item(iid, values=values, tags=tags)
+            self.rows[iid] = new_rows[iid]
+
+        if reorder:
+            # Keep the selection on rows that stay visible only
+            visible = set(new_order)
+            hidden = [iid for iid in self.tree.selection() if iid not in visible]
+            if hidden:
+                self.tree.selection_remove(*hidden)
+
+            # One call moves every row into place and detaches the rest;
+            # detached rows stay in the tree so they can be shown again cheaply
+            self.tree.set_children("", *new_order)
+
+            # Rows that were hidden no longer count as displayed
+            for iid in self.order:
+                if iid not in visible:
+                    self.rows.pop(iid, None)
+            self.order = tuple(new_order)
+
+    def update_rows(self, quests):
+        """Refresh the values of quests already in the view"""
+        for quest in quests:
+            iid = str(quest['row_id'])
+            if iid in self.rows:
+                row = quest_row(quest)
+                if row != self.rows[iid]:
+                    values, tags = row
+                    self.tree.item(iid, values=values, tags=tags)
+                    self.rows[iid] = row
@@ -0,0 +1,61 @@
+"""
+Write Journal for Fantasy Life Quest Tracker
+Append-only replay log for edits that have not been committed to SQLite yet
+"""
+
+import json
+import os
+
+
+class WriteJournal:
+    """Append-only log of queued database mutations
+
+    Every queued edit is appended as one JSON line and handed to the OS,
+    and the log is emptied once the edits are committed, so an app crash
+    loses no edit: on the next start the leftover entries are replayed.
+    Only the first entry of each flush window is fsynced (one sync per
+    group commit, not one per edit); an OS crash or power loss can still
+    lose the rest of that window, or the last commits (synchronous=NORMAL).
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.file = None
+
+    def append(self, entry):
+        """Record one mutation"""
+        first = self.file is None  # Reopened after every reset()
+        if first:
+            self.file = open(self.path, 'a', encoding='utf-8')
+        self.file.write(json.dumps(entry) + "\n")
+        self.file.flush()
+        if first:
+            os.fsync(self.file.fileno())
+
+    def replay(self):
+        """Read entries left behind by a previous run"""
+        if not os.path.exists(self.path):
+            return []
+
+        entries = []
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entries.append(json.loads(line))
+                except ValueError:
+                    # Torn final line from a crash mid-write
+                    break
+        return entries
+
+    def reset(self):
+        """Forget every entry (after they have been committed)"""
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None